@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import shutil
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
-from playwright.async_api import async_playwright, BrowserContext, Page
+from playwright.async_api import BrowserContext, Locator, Page, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.logger import get_logger
 
@@ -14,6 +18,122 @@ logger = get_logger("automator")
 # NotebookLM URL
 NOTEBOOKLM_URL = "https://notebooklm.google.com/"
 
+# UI 요소 선택자 (영문/한글 UI 모두 대응)
+NEW_NOTEBOOK_SEL = 'button:has-text("New notebook"), button:has-text("새 노트북")'
+ADD_SOURCE_SEL = (
+    'button:has-text("Add source"), button:has-text("소스 추가"), '
+    '[aria-label="Add source"], [aria-label="소스 추가"]'
+)
+WEBSITE_SEL = (
+    'button:has-text("Website"), [data-value="website"], '
+    'div:has-text("Website"):not(button)'
+)
+URL_INPUT_SEL = (
+    'input[type="url"], input[placeholder*="URL"], input[placeholder*="url"], textarea'
+)
+INSERT_SEL = 'button:has-text("Insert"), button:has-text("삽입")'
+SPINNER_SEL = '[role="progressbar"], .loading-spinner, mat-spinner'
+GENERATE_SEL = (
+    'button:has-text("Generate"), button:has-text("생성"), '
+    'button:has-text("Create Audio Overview")'
+)
+DOWNLOAD_SEL = (
+    'button:has-text("Download"), button:has-text("다운로드"), '
+    '[aria-label="Download"], [aria-label="다운로드"]'
+)
+AUDIO_READY_SEL = f'{DOWNLOAD_SEL}, button:has-text("Play"), audio'
+
+# 탭마다 미리 만들어 두는 Locator (키 → 선택자)
+LOCATOR_SELECTORS = {
+    "new_notebook": NEW_NOTEBOOK_SEL,
+    "add_source": ADD_SOURCE_SEL,
+    "website": WEBSITE_SEL,
+    "url_input": URL_INPUT_SEL,
+    "insert": INSERT_SEL,
+    "spinner": SPINNER_SEL,
+    "generate": GENERATE_SEL,
+    "audio_ready": AUDIO_READY_SEL,
+    "download": DOWNLOAD_SEL,
+}
+
+# 소스 분석 로딩 스피너 대기 시간 (ms)
+SPINNER_APPEAR_TIMEOUT_MS = 5000
+SOURCE_LOAD_TIMEOUT_MS = 60000
+
+# 탭 하나로 처리할 최대 URL 수 (초과 시 새 탭으로 교체)
+MAX_USES_PER_TAB = 20
+
+
+class TabPool:
+    """하나의 브라우저 컨텍스트를 공유하는 탭(Page) 풀
+
+    탭을 빌려 쓰고 반납하는 방식으로 여러 노트북 작업을 동시에 진행합니다.
+    실패했거나 max_uses만큼 사용된 탭은 반납 시 새 탭으로 교체합니다.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        size: int,
+        max_uses: int = MAX_USES_PER_TAB,
+    ) -> None:
+        self.size = size
+        self.max_uses = max_uses
+        self._context = context
+        self._queue: asyncio.Queue[Page] = asyncio.Queue()
+        self._uses: dict[Page, int] = {}
+        self._locators: dict[Page, dict[str, Locator]] = {}
+
+    async def open(self) -> None:
+        """풀 크기만큼 탭을 엽니다."""
+        for _ in range(self.size):
+            await self._add_page()
+
+    async def _add_page(self) -> None:
+        page = await self._context.new_page()
+        self._uses[page] = 0
+        # 선택자가 여러 요소에 매칭될 수 있으므로 첫 번째 요소 기준
+        self._locators[page] = {
+            key: page.locator(selector).first
+            for key, selector in LOCATOR_SELECTORS.items()
+        }
+        self._queue.put_nowait(page)
+
+    def locators(self, page: Page) -> dict[str, Locator]:
+        """탭에 미리 만들어 둔 Locator를 반환합니다."""
+        return self._locators[page]
+
+    async def acquire(self) -> Page:
+        """사용 가능한 탭을 빌립니다. 빈 탭이 없으면 반납될 때까지 대기합니다."""
+        return await self._queue.get()
+
+    async def release(self, page: Page, healthy: bool = True) -> None:
+        """탭을 풀에 반납합니다."""
+        self._uses[page] += 1
+        if healthy and self._uses[page] < self.max_uses:
+            self._queue.put_nowait(page)
+            return
+
+        # 실패했거나 사용 횟수를 초과한 탭은 새 탭으로 교체
+        del self._uses[page]
+        del self._locators[page]
+        try:
+            await page.close()
+        except Exception as e:
+            logger.warning("탭 종료 실패 (무시): %s", e)
+        await self._add_page()
+
+    async def close(self) -> None:
+        """풀의 모든 탭을 닫습니다."""
+        pages = list(self._uses)
+        self._uses.clear()
+        self._locators.clear()
+        for page in pages:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning("탭 종료 실패 (무시): %s", e)
+
 
 class NotebookLMAutomator:
     """Playwright를 사용한 NotebookLM UI 자동화
@@ -28,15 +148,17 @@ class NotebookLMAutomator:
         chrome_profile: str = "Default",
         timeout_seconds: int = 300,
         retry_count: int = 2,
+        max_tabs: int = 2,
     ) -> None:
-        self.chrome_user_data_dir = str(Path(chrome_user_data_dir).expanduser())
+        self.chrome_user_data_dir = chrome_user_data_dir
         self.chrome_profile = chrome_profile
         self.timeout_seconds = timeout_seconds
         self.retry_count = retry_count
+        self.max_tabs = max(1, max_tabs)
 
         self._playwright = None
         self._context: BrowserContext | None = None
-        self._page: Page | None = None
+        self._tabs: TabPool | None = None
 
     async def start_session(self) -> None:
         """크롬 프로필을 사용하여 브라우저 세션을 시작합니다."""
@@ -57,105 +179,70 @@ class NotebookLMAutomator:
             viewport={"width": 1280, "height": 800},
         )
 
-        # 새 탭 열기
-        self._page = await self._context.new_page()
-        logger.info("브라우저 세션 시작 완료")
+        # 동시 작업용 탭 풀 열기
+        self._tabs = TabPool(self._context, size=self.max_tabs)
+        await self._tabs.open()
+        logger.info("브라우저 세션 시작 완료 (탭 %d개)", self.max_tabs)
 
-    async def create_notebook(self, title: str) -> str:
-        """새 노트북을 생성하고 노트북 ID(URL)를 반환합니다."""
-        assert self._page is not None, "세션이 시작되지 않았습니다."
+    def _loc(self, page: Page, key: str) -> Locator:
+        """탭에 미리 만들어 둔 Locator를 반환합니다."""
+        assert self._tabs is not None, "세션이 시작되지 않았습니다."
+        return self._tabs.locators(page)[key]
 
+    async def create_notebook(self, page: Page, title: str) -> str:
+        """새 노트북을 생성하고 노트북 ID(URL)를 반환합니다."""
         logger.info("새 노트북 생성: %s", title)
-        await self._page.goto(NOTEBOOKLM_URL, wait_until="networkidle", timeout=30000)
-        await asyncio.sleep(2)  # 페이지 안정화 대기
+        await page.goto(NOTEBOOKLM_URL, wait_until="networkidle", timeout=30000)
 
         # "새 노트북" 버튼 클릭
-        new_notebook_btn = await self._page.wait_for_selector(
-            'button:has-text("New notebook"), button:has-text("새 노트북")',
-            timeout=15000,
-        )
-        if new_notebook_btn:
-            await new_notebook_btn.click()
-            await asyncio.sleep(3)
+        list_url = page.url
+        await self._loc(page, "new_notebook").click(timeout=15000)
+        # 노트북 페이지로 이동할 때까지 대기
+        await page.wait_for_url(lambda u: u != list_url, timeout=30000)
 
-        notebook_url = self._page.url
+        notebook_url = page.url
         logger.info("노트북 생성 완료: %s", notebook_url)
         return notebook_url
 
-    async def add_website_source(self, notebook_id: str, url: str) -> None:
+    async def add_website_source(self, page: Page, notebook_id: str, url: str) -> None:
         """노트북에 Website 소스를 추가합니다."""
-        assert self._page is not None, "세션이 시작되지 않았습니다."
-
         logger.info("Website 소스 추가: %s", url)
 
         # "소스 추가" 또는 "Add source" 버튼 클릭
-        add_source_btn = await self._page.wait_for_selector(
-            'button:has-text("Add source"), button:has-text("소스 추가"), '
-            '[aria-label="Add source"], [aria-label="소스 추가"]',
-            timeout=15000,
-        )
-        if add_source_btn:
-            await add_source_btn.click()
-            await asyncio.sleep(1)
+        await self._loc(page, "add_source").click(timeout=15000)
 
         # "Website" 옵션 선택
-        website_option = await self._page.wait_for_selector(
-            'button:has-text("Website"), [data-value="website"], '
-            'div:has-text("Website"):not(button)',
-            timeout=10000,
-        )
-        if website_option:
-            await website_option.click()
-            await asyncio.sleep(1)
+        await self._loc(page, "website").click(timeout=10000)
 
         # URL 입력
-        url_input = await self._page.wait_for_selector(
-            'input[type="url"], input[placeholder*="URL"], '
-            'input[placeholder*="url"], textarea',
-            timeout=10000,
-        )
-        if url_input:
-            await url_input.fill(url)
-            await asyncio.sleep(0.5)
+        await self._loc(page, "url_input").fill(url, timeout=10000)
 
         # "Insert" 또는 "삽입" 버튼 클릭
-        insert_btn = await self._page.wait_for_selector(
-            'button:has-text("Insert"), button:has-text("삽입")',
-            timeout=10000,
-        )
-        if insert_btn:
-            await insert_btn.click()
+        await self._loc(page, "insert").click(timeout=10000)
 
         # 소스 분석 완료 대기 (최대 60초)
         logger.info("소스 분석 대기 중...")
-        await asyncio.sleep(10)  # 기본 대기
+        await page.wait_for_load_state("networkidle")
 
-        # 분석 완료 시그널 대기 (소스가 로드되었는지 확인)
-        for _ in range(10):
-            # 로딩 스피너가 사라질 때까지 대기
-            spinner = await self._page.query_selector(
-                '[role="progressbar"], .loading-spinner, mat-spinner'
-            )
-            if not spinner:
-                break
-            await asyncio.sleep(5)
+        # 로딩 스피너가 나타났다가 사라지면 분석 완료로 판단
+        spinner = self._loc(page, "spinner")
+        try:
+            await spinner.wait_for(state="attached", timeout=SPINNER_APPEAR_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass  # 스피너 없이 바로 로드된 경우
+        try:
+            await spinner.wait_for(state="detached", timeout=SOURCE_LOAD_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            logger.warning("소스 분석 대기 시간 초과, 계속 진행합니다.")
 
         logger.info("Website 소스 추가 완료")
 
-    async def generate_audio(self, notebook_id: str) -> str:
+    async def generate_audio(self, page: Page, notebook_id: str) -> str:
         """Audio Overview를 생성합니다."""
-        assert self._page is not None, "세션이 시작되지 않았습니다."
-
         logger.info("오디오 생성 시작")
 
         # "Audio Overview" 섹션 찾기 및 "Generate" 클릭
-        generate_btn = await self._page.wait_for_selector(
-            'button:has-text("Generate"), button:has-text("생성"), '
-            'button:has-text("Create Audio Overview")',
-            timeout=30000,
-        )
-        if generate_btn:
-            await generate_btn.click()
+        await self._loc(page, "generate").click(timeout=30000)
 
         # 오디오 생성 완료 대기 (최대 timeout_seconds)
         logger.info("오디오 생성 대기 중 (최대 %d초)...", self.timeout_seconds)
@@ -163,12 +250,7 @@ class NotebookLMAutomator:
 
         try:
             # 다운로드 버튼 또는 재생 버튼이 나타날 때까지 대기
-            await self._page.wait_for_selector(
-                'button:has-text("Download"), button:has-text("다운로드"), '
-                '[aria-label="Download"], [aria-label="다운로드"], '
-                'button:has-text("Play"), audio',
-                timeout=timeout_ms,
-            )
+            await self._loc(page, "audio_ready").wait_for(timeout=timeout_ms)
             logger.info("오디오 생성 완료")
         except Exception:
             logger.warning("오디오 생성 타임아웃 (%d초)", self.timeout_seconds)
@@ -178,47 +260,38 @@ class NotebookLMAutomator:
 
         return notebook_id
 
-    async def download_audio(self, notebook_id: str, save_dir: str) -> Path:
+    async def download_audio(self, page: Page, notebook_id: str, save_dir: str) -> Path:
         """생성된 오디오 파일을 다운로드합니다."""
-        assert self._page is not None, "세션이 시작되지 않았습니다."
-
         save_path = Path(save_dir)
         save_path.mkdir(parents=True, exist_ok=True)
 
         logger.info("오디오 다운로드 시작: %s", save_dir)
 
         # 다운로드 이벤트 대기
-        async with self._page.expect_download(timeout=60000) as download_info:
-            download_btn = await self._page.wait_for_selector(
-                'button:has-text("Download"), button:has-text("다운로드"), '
-                '[aria-label="Download"], [aria-label="다운로드"]',
-                timeout=15000,
-            )
-            if download_btn:
-                await download_btn.click()
+        async with page.expect_download(timeout=60000) as download_info:
+            await self._loc(page, "download").click(timeout=15000)
 
         download = await download_info.value
         suggested_filename = download.suggested_filename or "audio.wav"
 
-        # 파일 저장
+        # 파일 저장: 임시 다운로드 파일을 옮기기만 함 (같은 볼륨이면 rename 1회)
         file_path = save_path / suggested_filename
-        await download.save_as(str(file_path))
+        tmp_path = await download.path()
+        try:
+            os.replace(tmp_path, file_path)
+        except OSError:
+            shutil.move(tmp_path, file_path)
         logger.info("오디오 다운로드 완료: %s", file_path)
 
         return file_path
 
-    async def cleanup_notebook(self, notebook_id: str) -> None:
+    async def cleanup_notebook(self, page: Page, notebook_id: str) -> None:
         """노트북을 삭제합니다."""
-        assert self._page is not None, "세션이 시작되지 않았습니다."
-
         logger.info("노트북 정리: %s", notebook_id)
 
         try:
             # 노트북 목록으로 이동
-            await self._page.goto(
-                NOTEBOOKLM_URL, wait_until="networkidle", timeout=30000
-            )
-            await asyncio.sleep(2)
+            await page.goto(NOTEBOOKLM_URL, wait_until="networkidle", timeout=30000)
 
             # 노트북 삭제 로직 (점 세 개 메뉴 → 삭제)
             # NotebookLM UI가 변경될 수 있으므로 에러를 무시합니다
@@ -228,19 +301,22 @@ class NotebookLMAutomator:
 
     async def close_session(self) -> None:
         """브라우저 세션을 종료합니다."""
+        if self._tabs:
+            await self._tabs.close()
+            self._tabs = None
         if self._context:
             await self._context.close()
             self._context = None
         if self._playwright:
             await self._playwright.stop()
             self._playwright = None
-        self._page = None
         logger.info("브라우저 세션 종료")
 
     async def process_url(self, url: str, title: str, save_dir: str) -> Path | None:
         """URL 하나에 대한 전체 자동화 파이프라인을 실행합니다.
 
-        노트북 생성 → 소스 추가 → 오디오 생성 → 다운로드 → 정리
+        탭 풀에서 탭 하나를 빌려 노트북 생성 → 소스 추가 → 오디오 생성 →
+        다운로드 → 정리를 진행한 뒤 탭을 반납합니다.
 
         Args:
             url: 처리할 웹 URL
@@ -250,14 +326,28 @@ class NotebookLMAutomator:
         Returns:
             다운로드된 오디오 파일 경로 (실패 시 None)
         """
+        assert self._tabs is not None, "세션이 시작되지 않았습니다."
+
+        page = await self._tabs.acquire()
+        audio_path = None
+        try:
+            audio_path = await self._run_pipeline(page, url, title, save_dir)
+            return audio_path
+        finally:
+            await self._tabs.release(page, healthy=audio_path is not None)
+
+    async def _run_pipeline(
+        self, page: Page, url: str, title: str, save_dir: str
+    ) -> Path | None:
+        """주어진 탭에서 재시도를 포함한 자동화 파이프라인을 실행합니다."""
         notebook_id = None
         for attempt in range(self.retry_count + 1):
             try:
-                notebook_id = await self.create_notebook(title)
-                await self.add_website_source(notebook_id, url)
-                await self.generate_audio(notebook_id)
-                audio_path = await self.download_audio(notebook_id, save_dir)
-                await self.cleanup_notebook(notebook_id)
+                notebook_id = await self.create_notebook(page, title)
+                await self.add_website_source(page, notebook_id, url)
+                await self.generate_audio(page, notebook_id)
+                audio_path = await self.download_audio(page, notebook_id, save_dir)
+                await self.cleanup_notebook(page, notebook_id)
                 return audio_path
 
             except Exception as e:
@@ -268,9 +358,57 @@ class NotebookLMAutomator:
                     e,
                 )
                 if notebook_id:
-                    await self.cleanup_notebook(notebook_id)
+                    await self.cleanup_notebook(page, notebook_id)
                 if attempt < self.retry_count:
                     logger.info("재시도 대기 중...")
                     await asyncio.sleep(5)
 
         return None
+
+    async def run_batch(
+        self,
+        urls: list[tuple[str, str]],
+        save_dir: str,
+        on_result: Callable[[int, Path | None], Awaitable[None]] | None = None,
+    ) -> list[Path | None]:
+        """여러 URL을 하나의 브라우저 세션에서 동시에 처리합니다.
+
+        세션은 한 번만 시작하며, 탭 풀 크기(max_tabs)만큼의 워커가 작업 큐에서
+        URL을 하나씩 가져가 처리합니다. 오래 걸리는 노트북이 있어도 다른 워커는
+        다음 URL을 계속 처리합니다.
+
+        Args:
+            urls: (URL, 노트북 제목) 튜플 리스트
+            save_dir: 오디오 저장 디렉토리
+            on_result: 각 URL 처리가 끝날 때마다 (입력 인덱스, 결과)로 호출되는 콜백
+
+        Returns:
+            입력 순서와 동일한 오디오 파일 경로 리스트 (실패 항목은 None)
+        """
+        jobs: asyncio.Queue[tuple[int, str, str]] = asyncio.Queue()
+        for i, (url, title) in enumerate(urls):
+            jobs.put_nowait((i, url, title))
+        results: list[Path | None] = [None] * len(urls)
+
+        async def _worker() -> None:
+            while not jobs.empty():
+                i, url, title = jobs.get_nowait()
+                logger.info("오디오 생성 (%d/%d): %s", i + 1, len(urls), title)
+                results[i] = await self.process_url(url, title, save_dir)
+                if on_result:
+                    await on_result(i, results[i])
+
+        workers: list[asyncio.Task[None]] = []
+        try:
+            await self.start_session()
+            workers = [
+                asyncio.create_task(_worker())
+                for _ in range(min(self.max_tabs, len(urls)))
+            ]
+            await asyncio.gather(*workers)
+            return results
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.close_session()
@@ -11,143 +11,168 @@ import os
 import sys
 from pathlib import Path
 
+# 검증 결과: (통과 여부, 출력 메시지)
+CheckResult = tuple[bool, str]
 
-def check_python_version() -> bool:
+
+def check_python_version() -> CheckResult:
     """Python 버전 확인"""
     version = sys.version_info
     ok = version >= (3, 11)
     status = "✅" if ok else "❌"
-    print(f"{status} Python {version.major}.{version.minor}.{version.micro} ... {'OK' if ok else 'Python 3.11+ 필요'}")
-    return ok
+    msg = "OK" if ok else "Python 3.11+ 필요"
+    return ok, (
+        f"{status} Python {version.major}.{version.minor}.{version.micro} ... {msg}"
+    )
 
 
-def check_gmail_credentials(config_path: str) -> bool:
+def check_gmail_credentials(config_path: str) -> CheckResult:
     """Gmail 인증 파일 확인"""
     exists = Path(config_path).exists()
     status = "✅" if exists else "⚠️"
     msg = "OK" if exists else f"파일 없음 ({config_path})"
-    print(f"{status} Gmail credentials ... {msg}")
-    return exists
+    return exists, f"{status} Gmail credentials ... {msg}"
 
 
-def check_gmail_token(token_path: str) -> bool:
+def check_gmail_token(token_path: str) -> CheckResult:
     """Gmail 토큰 파일 확인"""
     exists = Path(token_path).exists()
     status = "✅" if exists else "⚠️"
     msg = "OK" if exists else f"최초 인증 필요 (poetry run python -m src.collector.gmail_auth)"
-    print(f"{status} Gmail token ... {msg}")
-    return exists
+    return exists, f"{status} Gmail token ... {msg}"
 
 
-async def check_telegram_bot(bot_token: str) -> bool:
+async def check_telegram_bot(bot_token: str) -> CheckResult:
     """텔레그램 봇 연결 확인"""
     if not bot_token:
-        print("⚠️  Telegram bot connection ... 봇 토큰 미설정")
-        return False
+        return False, "⚠️  Telegram bot connection ... 봇 토큰 미설정"
 
     try:
         from telegram import Bot
 
         bot = Bot(token=bot_token)
         me = await bot.get_me()
-        print(f"✅ Telegram bot connection ... OK (@{me.username})")
-        return True
+        return True, f"✅ Telegram bot connection ... OK (@{me.username})"
     except Exception as e:
-        print(f"❌ Telegram bot connection ... 실패 ({e})")
-        return False
+        return False, f"❌ Telegram bot connection ... 실패 ({e})"
 
 
-def check_chrome_profile(user_data_dir: str, profile: str) -> bool:
+def check_chrome_profile(user_data_dir: str, profile: str) -> CheckResult:
     """크롬 프로필 확인"""
-    profile_path = Path(user_data_dir).expanduser() / profile
+    profile_path = Path(user_data_dir) / profile
     exists = profile_path.exists()
     status = "✅" if exists else "❌"
     msg = "OK" if exists else f"프로필 없음 ({profile_path})"
-    print(f"{status} Chrome profile found ... {msg}")
-    return exists
+    return exists, f"{status} Chrome profile found ... {msg}"
 
 
-def check_sqlite() -> bool:
+def check_sqlite() -> CheckResult:
     """SQLite 사용 가능 확인"""
     try:
         import sqlite3
 
-        print(f"✅ SQLite database ... OK (v{sqlite3.sqlite_version})")
-        return True
+        return True, f"✅ SQLite database ... OK (v{sqlite3.sqlite_version})"
     except ImportError:
-        print("❌ SQLite database ... sqlite3 모듈 없음")
-        return False
+        return False, "❌ SQLite database ... sqlite3 모듈 없음"
 
 
-def check_playwright() -> bool:
+def check_playwright() -> CheckResult:
     """Playwright 설치 확인"""
     try:
         from playwright.sync_api import sync_playwright
 
-        print("✅ Playwright ... OK")
-        return True
+        return True, "✅ Playwright ... OK"
     except ImportError:
-        print("❌ Playwright ... 미설치 (poetry run playwright install chromium)")
-        return False
+        return False, (
+            "❌ Playwright ... 미설치 (poetry run playwright install chromium)"
+        )
 
 
-def check_config_files() -> bool:
+def check_config_files() -> CheckResult:
     """설정 파일 존재 확인"""
     settings_exists = Path("config/settings.yaml").exists()
     env_exists = Path("config/.env").exists()
+    lines = []
 
     if settings_exists:
-        print("✅ config/settings.yaml ... OK")
+        lines.append("✅ config/settings.yaml ... OK")
     else:
-        print("⚠️  config/settings.yaml ... 없음 (cp config/settings.example.yaml config/settings.yaml)")
+        lines.append("⚠️  config/settings.yaml ... 없음 (cp config/settings.example.yaml config/settings.yaml)")
 
     if env_exists:
-        print("✅ config/.env ... OK")
+        lines.append("✅ config/.env ... OK")
     else:
-        print("⚠️  config/.env ... 없음 (cp config/.env.example config/.env)")
+        lines.append("⚠️  config/.env ... 없음 (cp config/.env.example config/.env)")
 
-    return settings_exists and env_exists
+    return settings_exists and env_exists, "\n".join(lines)
 
 
 async def main() -> None:
-    """모든 설정 항목을 검증합니다."""
+    """모든 설정 항목을 검증합니다.
+
+    각 검증은 동시에 실행하고, 출력은 항목 순서대로 모아서 표시합니다.
+    """
     print("=" * 50)
     print("  LetterCast Pro - 환경 설정 검증")
     print("=" * 50)
     print()
 
-    results = []
-
-    # 기본 확인
-    results.append(check_python_version())
-    results.append(check_sqlite())
-    results.append(check_playwright())
-    print()
-
-    # 설정 파일 확인
-    results.append(check_config_files())
-    print()
-
-    # 설정 기반 확인
+    # 설정을 먼저 읽은 뒤 검증 코루틴을 만듦
+    # (로드 중 예외가 나도 기다리지 않은 코루틴이 남지 않도록)
+    settings = None
+    settings_error: list[str] = []
     try:
         from src.config import Settings
 
         settings = Settings.load()
+    except FileNotFoundError:
+        settings_error = [
+            "⚠️  설정 파일 없음 - 세부 검증 스킵",
+            "   config/settings.example.yaml을 복사하여 config/settings.yaml을 생성하세요.",
+        ]
+
+    # 기본 확인 / 설정 파일 확인
+    groups = [
+        [
+            asyncio.to_thread(check_python_version),
+            asyncio.to_thread(check_sqlite),
+            asyncio.to_thread(check_playwright),
+        ],
+        [asyncio.to_thread(check_config_files)],
+    ]
 
-        results.append(check_gmail_credentials(settings.gmail.credentials_path))
-        results.append(check_gmail_token(settings.gmail.token_path))
-        results.append(
-            check_chrome_profile(
-                settings.notebooklm.chrome_user_data_dir,
-                settings.notebooklm.chrome_profile,
-            )
+    # 설정 기반 확인
+    if settings is not None:
+        groups.append(
+            [
+                asyncio.to_thread(
+                    check_gmail_credentials, settings.gmail.credentials_path
+                ),
+                asyncio.to_thread(check_gmail_token, settings.gmail.token_path),
+                asyncio.to_thread(
+                    check_chrome_profile,
+                    settings.notebooklm.chrome_user_data_dir,
+                    settings.notebooklm.chrome_profile,
+                ),
+                check_telegram_bot(settings.telegram.bot_token),
+            ]
         )
-        results.append(await check_telegram_bot(settings.telegram.bot_token))
-    except FileNotFoundError:
-        print("⚠️  설정 파일 없음 - 세부 검증 스킵")
-        print("   config/settings.example.yaml을 복사하여 config/settings.yaml을 생성하세요.")
 
-    print()
+    group_results = await asyncio.gather(
+        *(asyncio.gather(*checks) for checks in groups)
+    )
+
+    results = []
+    for checks in group_results:
+        for ok, message in checks:
+            print(message)
+            results.append(ok)
+        print()
+    for line in settings_error:
+        print(line)
+    if settings_error:
+        print()
+
     print("=" * 50)
 
     if all(results):
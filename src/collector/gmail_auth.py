@@ -9,6 +9,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -18,6 +20,33 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 # Gmail API 읽기 전용 스코프
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
 
+# 프로세스 내 Credentials 캐시 (token_path → Credentials)
+_credentials_cache: dict[str, Credentials] = {}
+
+
+def _save_token(token_file: Path, token_json: str) -> bool:
+    """토큰을 임시 파일에 쓴 뒤 교체하는 방식으로 원자적으로 저장합니다.
+
+    기존 파일과 내용이 같으면 쓰지 않습니다.
+
+    Returns:
+        실제로 파일을 썼는지 여부
+    """
+    if token_file.exists() and token_file.read_text(encoding="utf-8") == token_json:
+        return False
+
+    token_file.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=token_file.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(token_json)
+    try:
+        os.replace(tmp.name, token_file)
+    except OSError:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+    return True
+
 
 def authenticate(
     credentials_path: str = "config/credentials.json",
@@ -27,6 +56,7 @@ def authenticate(
 
     토큰이 이미 존재하면 로드하고, 만료되었으면 갱신합니다.
     토큰이 없으면 브라우저를 통해 OAuth 인증을 진행합니다.
+    같은 프로세스에서 한 번 로드한 토큰은 파일을 다시 읽지 않고 재사용합니다.
 
     Args:
         credentials_path: OAuth 클라이언트 시크릿 파일 경로
@@ -35,11 +65,13 @@ def authenticate(
     Returns:
         유효한 Credentials 인스턴스
     """
-    creds: Credentials | None = None
     token_file = Path(token_path)
+    creds = _credentials_cache.get(token_path)
+    if creds and creds.valid:
+        return creds
 
     # 기존 토큰 로드
-    if token_file.exists():
+    if creds is None and token_file.exists():
         creds = Credentials.from_authorized_user_file(str(token_file), SCOPES)
 
     # 토큰이 없거나 만료된 경우
@@ -61,11 +93,10 @@ def authenticate(
             creds = flow.run_local_server(port=0)
 
         # 토큰 저장
-        token_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_file, "w") as f:
-            f.write(creds.to_json())
-        print(f"토큰 저장 완료: {token_path}")
+        if _save_token(token_file, creds.to_json()):
+            print(f"토큰 저장 완료: {token_path}")
 
+    _credentials_cache[token_path] = creds
     return creds
 
 
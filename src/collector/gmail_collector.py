@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import re
+from collections.abc import Iterator
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from selectolax.lexbor import LexborHTMLParser
 
 from src.collector.gmail_auth import authenticate
 from src.logger import get_logger
@@ -30,6 +34,16 @@ EXCLUDED_DOMAINS = {
     "schemas.microsoft.com",
     "aka.ms",
 }
+EXCLUDED_RE = re.compile("|".join(re.escape(d) for d in EXCLUDED_DOMAINS))
+
+# MIME 파트의 Content-Type 헤더에서 charset 추출
+CHARSET_RE = re.compile(r'charset\s*=\s*"?([^";\s]+)', re.IGNORECASE)
+
+# 디코딩 없이 bytes 그대로 파서에 넘길 수 있는 인코딩 (파서는 UTF-8로 해석)
+UTF8_CHARSETS = frozenset({"utf-8", "utf8", "us-ascii", "ascii"})
+
+# Gmail batch 요청 1회에 담을 최대 호출 수 (Gmail 권장 상한)
+BATCH_SIZE = 50
 
 
 class GmailCollector:
@@ -46,26 +60,57 @@ class GmailCollector:
         self.token_path = token_path
         self.allowed_senders = allowed_senders or []
         self.max_results = max_results
+        self._creds = None
         self._service = None
 
     async def _get_service(self):
-        """Gmail API 서비스를 초기화합니다."""
+        """Gmail API 서비스를 초기화합니다.
+
+        이미 만든 서비스의 토큰이 만료되었으면 여기서 한 번 갱신합니다.
+        (동시 요청 스레드들이 같은 Credentials를 동시에 갱신하지 않도록)
+        """
+        if self._service is not None and not self._creds.valid:
+            self._creds = authenticate(self.credentials_path, self.token_path)
         if self._service is None:
-            creds = authenticate(self.credentials_path, self.token_path)
-            self._service = build("gmail", "v1", credentials=creds)
+            self._creds = authenticate(self.credentials_path, self.token_path)
+            # 패키지에 포함된 discovery 문서를 사용 (네트워크 조회/캐시 생략)
+            self._service = build(
+                "gmail",
+                "v1",
+                credentials=self._creds,
+                cache_discovery=False,
+                static_discovery=True,
+            )
         return self._service
 
+    async def _execute(self, request):
+        """API 요청을 스레드 풀에서 실행합니다.
+
+        httplib2 연결은 스레드 간에 공유할 수 없으므로 요청마다 새로 만듭니다.
+        """
+        http = AuthorizedHttp(self._creds, http=httplib2.Http())
+        return await asyncio.to_thread(request.execute, http=http)
+
     async def fetch_unread_urls(self) -> list[CollectedItem]:
-        """모든 허용된 발신자의 읽지 않은 메일에서 URL을 추출합니다."""
+        """모든 허용된 발신자의 읽지 않은 메일에서 URL을 추출합니다.
+
+        발신자별 조회는 동시에 진행됩니다.
+        """
         items: list[CollectedItem] = []
 
-        for sender in self.allowed_senders:
-            try:
-                sender_items = await self._fetch_from_sender(sender)
-                items.extend(sender_items)
-                logger.info("%s로부터 %d개 URL 수집", sender, len(sender_items))
-            except Exception as e:
-                logger.error("%s 수집 실패: %s", sender, e)
+        # 발신자별 요청을 동시에 보내기 전에 서비스 생성과 토큰 갱신을 마침
+        await self._get_service()
+        results = await asyncio.gather(
+            *(self._fetch_from_sender(sender) for sender in self.allowed_senders),
+            return_exceptions=True,
+        )
+
+        for sender, result in zip(self.allowed_senders, results):
+            if isinstance(result, BaseException):
+                logger.error("%s 수집 실패: %s", sender, result)
+                continue
+            items.extend(result)
+            logger.info("%s로부터 %d개 URL 수집", sender, len(result))
 
         logger.info("Gmail 총 %d개 URL 수집 완료", len(items))
         return items
@@ -75,11 +120,10 @@ class GmailCollector:
         service = await self._get_service()
         query = f"from:{sender} is:unread"
 
-        results = (
+        results = await self._execute(
             service.users()
             .messages()
             .list(userId="me", q=query, maxResults=self.max_results)
-            .execute()
         )
 
         messages = results.get("messages", [])
@@ -88,16 +132,11 @@ class GmailCollector:
             return []
 
         items = []
-        for msg_ref in messages:
-            msg = (
-                service.users()
-                .messages()
-                .get(userId="me", id=msg_ref["id"], format="full")
-                .execute()
-            )
-
-            subject = self._get_header(msg, "Subject") or "제목 없음"
-            body_html = self._get_body(msg)
+        # 같은 배치의 항목은 수집 시각 하나를 공유
+        collected_at = datetime.now()
+        for msg in await self._get_messages(service, messages):
+            headers, body_html = self._parse_payload(msg)
+            subject = headers.get("subject") or "제목 없음"
             urls = self._extract_urls(body_html)
 
             for url in urls:
@@ -107,81 +146,139 @@ class GmailCollector:
                         title=subject,
                         source=SourceType.GMAIL,
                         source_name=sender,
-                        collected_at=datetime.now(),
+                        collected_at=collected_at,
                     )
                 )
 
         return items
 
+    async def _get_messages(self, service, message_refs: list[dict]) -> list[dict]:
+        """메일 본문을 batch 요청으로 한 번에 조회합니다.
+
+        조회에 실패한 메일은 건너뛰며, 결과는 message_refs 순서를 따릅니다.
+        """
+        responses: dict[str, dict] = {}
+
+        def _on_response(request_id: str, response: dict, exception) -> None:
+            if exception is not None:
+                logger.warning("메일 조회 실패 (%s): %s", request_id, exception)
+                return
+            responses[request_id] = response
+
+        for start in range(0, len(message_refs), BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=_on_response)
+            for msg_ref in message_refs[start : start + BATCH_SIZE]:
+                batch.add(
+                    service.users()
+                    .messages()
+                    .get(userId="me", id=msg_ref["id"], format="full"),
+                    request_id=msg_ref["id"],
+                )
+            await self._execute(batch)
+
+        return [
+            responses[msg_ref["id"]]
+            for msg_ref in message_refs
+            if msg_ref["id"] in responses
+        ]
+
     async def mark_as_read(self, message_id: str) -> None:
         """메일을 읽음으로 표시합니다."""
         service = await self._get_service()
-        service.users().messages().modify(
-            userId="me",
-            id=message_id,
-            body={"removeLabelIds": ["UNREAD"]},
-        ).execute()
+        await self._execute(
+            service.users()
+            .messages()
+            .modify(
+                userId="me",
+                id=message_id,
+                body={"removeLabelIds": ["UNREAD"]},
+            )
+        )
         logger.debug("메일 읽음 처리: %s", message_id)
 
-    @staticmethod
-    def _get_header(msg: dict, name: str) -> str | None:
-        """메일 헤더에서 특정 값을 추출합니다."""
+    @classmethod
+    def _parse_payload(cls, msg: dict) -> tuple[dict[str, str], bytes | str]:
+        """메일에서 헤더 딕셔너리와 본문 HTML을 한 번에 추출합니다.
+
+        헤더 이름은 소문자로 정규화되며, 같은 이름이 여러 번 나오면
+        첫 번째 값을 사용합니다.
+        """
         headers = msg.get("payload", {}).get("headers", [])
-        for header in headers:
-            if header["name"].lower() == name.lower():
-                return header["value"]
-        return None
+        header_map = {h["name"].lower(): h["value"] for h in reversed(headers)}
+        return header_map, cls._get_body(msg)
 
-    @staticmethod
-    def _get_body(msg: dict) -> str:
-        """메일 본문 HTML을 추출합니다."""
+    @classmethod
+    def _get_body(cls, msg: dict) -> bytes | str:
+        """메일 본문을 추출합니다.
+
+        UTF-8(또는 charset 미지정) 본문은 디코딩하지 않은 bytes로, 그 밖의
+        charset은 해당 인코딩으로 디코딩한 str로 반환합니다.
+        HTML 파트가 없으면 text/plain 파트를 대신 사용합니다.
+        """
         payload = msg.get("payload", {})
 
         # 단순 메일 (본문이 바로 있는 경우)
-        body_data = payload.get("body", {}).get("data")
-        if body_data:
-            return base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-
-        # 멀티파트 메일
-        parts = payload.get("parts", [])
-        for part in parts:
-            mime_type = part.get("mimeType", "")
-            if mime_type == "text/html":
-                data = part.get("body", {}).get("data", "")
-                if data:
-                    return base64.urlsafe_b64decode(data).decode(
-                        "utf-8", errors="ignore"
-                    )
+        if payload.get("body", {}).get("data"):
+            return cls._decode_part(payload)
 
-            # 중첩 멀티파트 처리
-            sub_parts = part.get("parts", [])
-            for sub in sub_parts:
-                if sub.get("mimeType") == "text/html":
-                    data = sub.get("body", {}).get("data", "")
-                    if data:
-                        return base64.urlsafe_b64decode(data).decode(
-                            "utf-8", errors="ignore"
-                        )
+        # 멀티파트 메일 (깊이와 관계없이 첫 번째 text/html, 없으면 text/plain 파트)
+        for mime_type in ("text/html", "text/plain"):
+            for part in cls._walk_parts(payload, mime_type):
+                if part.get("body", {}).get("data"):
+                    return cls._decode_part(part)
 
-        return ""
+        return b""
 
     @staticmethod
-    def _extract_urls(html: str) -> list[str]:
-        """HTML 본문에서 의미 있는 URL을 추출합니다."""
+    def _decode_part(part: dict) -> bytes | str:
+        """파트 본문을 base64 디코딩하고, UTF-8이 아니면 charset으로 디코딩합니다."""
+        raw = base64.urlsafe_b64decode(part["body"]["data"])
+
+        charset = None
+        for header in part.get("headers", []):
+            if header["name"].lower() == "content-type":
+                match = CHARSET_RE.search(header["value"])
+                if match:
+                    charset = match.group(1).lower()
+                break
+
+        if charset is None or charset in UTF8_CHARSETS:
+            return raw
+        try:
+            return raw.decode(charset, errors="replace")
+        except LookupError:
+            logger.debug("알 수 없는 charset: %s", charset)
+            return raw
+
+    @classmethod
+    def _walk_parts(cls, part: dict, mime_type: str) -> Iterator[dict]:
+        """MIME 파트 트리를 깊이 우선으로 순회하며 mime_type 파트를 반환합니다."""
+        if part.get("mimeType") == mime_type:
+            yield part
+        for sub in part.get("parts", []):
+            yield from cls._walk_parts(sub, mime_type)
+
+    @staticmethod
+    def _extract_urls(html: bytes | str) -> list[str]:
+        """HTML 본문에서 의미 있는 URL을 추출합니다.
+
+        bytes는 UTF-8로 해석하므로, 다른 인코딩의 본문은 str로 디코딩해서
+        넘겨야 합니다. (_get_body가 처리)
+        """
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
         urls: list[str] = []
         seen: set[str] = set()
 
         # <a> 태그의 href에서 추출
-        for link in soup.find_all("a", href=True):
-            url = link["href"].strip()
+        for node in tree.css("a[href]"):
+            url = (node.attributes.get("href") or "").strip()
             if not url.startswith("http"):
                 continue
             # 제외 도메인 필터링
-            if any(domain in url for domain in EXCLUDED_DOMAINS):
+            if EXCLUDED_RE.search(url) is not None:
                 continue
             # URL 정리 (트래킹 파라미터 등은 유지 - 원본 보존)
             if url not in seen:
@@ -189,11 +286,11 @@ class GmailCollector:
                 urls.append(url)
 
         # 본문 텍스트에서 추가 URL 탐색
-        text = soup.get_text()
-        for match in URL_PATTERN.finditer(text):
-            url = match.group(0).rstrip(".,;:!?)")
+        text = tree.body.text(separator=" ") if tree.body else ""
+        for url in URL_PATTERN.findall(text):
+            url = url.rstrip(".,;:!?)")
             if url not in seen:
-                if not any(domain in url for domain in EXCLUDED_DOMAINS):
+                if EXCLUDED_RE.search(url) is None:
                     seen.add(url)
                     urls.append(url)
 
@@ -2,69 +2,240 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from io import BytesIO
 
-import feedparser
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import httpx
+from lxml import etree
+from playwright.async_api import Browser, async_playwright
 
+from src.database.feed_cache import FeedCache, FeedState
 from src.logger import get_logger
 from src.models import CollectedItem, SourceType, TargetSite
 
 logger = get_logger("collector.web")
 
+# HTML 사이트 동시 수집 수 (동시에 열어 둘 탭 수)
+MAX_CONCURRENT_HTML = 2
+
+# 피드 XML 네임스페이스 및 게시글 태그 (RSS 2.0 / RSS 1.0 / Atom)
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+FEED_ENTRY_TAGS = ("item", f"{RSS1_NS}item", f"{ATOM_NS}entry")
+
+# 요소의 href와 텍스트를 한 번에 반환하는 스크립트
+EXTRACT_LINK_JS = """(el) => ({
+    href: el.getAttribute("href"),
+    text: (el.innerText || "").trim(),
+})"""
+
+# 브라우저 하나로 처리할 최대 페이지 수 (초과 시 브라우저 재시작)
+MAX_USES_PER_BROWSER = 50
+
 
 class WebCollector:
     """대상 웹사이트에서 최신 게시글 URL을 수집합니다."""
 
-    def __init__(self, target_sites: list[TargetSite] | None = None) -> None:
+    def __init__(
+        self,
+        target_sites: list[TargetSite] | None = None,
+        feed_cache: FeedCache | None = None,
+    ) -> None:
         self.target_sites = target_sites or []
+        self.feed_cache = feed_cache
+
+        self._playwright = None
+        self._browser: Browser | None = None
+        self._browser_uses = 0
+        self._active_pages = 0
+        self._browser_lock = asyncio.Lock()
+        self._http: httpx.AsyncClient | None = None
+        # 수집한 게시글이 DB에 저장된 뒤에 기록할 피드 상태 (피드 URL → 상태)
+        self.pending_feed_states: dict[str, FeedState] = {}
+
+    async def _ensure_browser(self) -> Browser:
+        """공유 Chromium 브라우저를 반환합니다. (최초 호출 시 실행)
+
+        MAX_USES_PER_BROWSER회 사용된 브라우저는 열린 페이지가 없을 때 재시작합니다.
+        """
+        async with self._browser_lock:
+            if (
+                self._browser is not None
+                and self._browser_uses >= MAX_USES_PER_BROWSER
+                and self._active_pages == 0
+            ):
+                await self._browser.close()
+                self._browser = None
+
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._browser_uses = 0
+
+            self._browser_uses += 1
+            self._active_pages += 1
+            return self._browser
+
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트, 브라우저와 Playwright를 종료합니다."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
     async def fetch_latest_urls(self) -> list[CollectedItem]:
-        """모든 대상 사이트에서 최신 URL을 수집합니다."""
+        """모든 대상 사이트에서 최신 URL을 수집합니다.
+
+        사이트별 수집은 동시에 진행되며, HTML 사이트는
+        MAX_CONCURRENT_HTML개까지만 동시에 처리합니다.
+        """
         items: list[CollectedItem] = []
+        html_slots = asyncio.Semaphore(MAX_CONCURRENT_HTML)
 
-        for site in self.target_sites:
-            try:
-                if site.type == "rss":
-                    site_items = await self._fetch_from_rss(site)
-                else:
-                    site_items = await self._fetch_from_html(site)
-                items.extend(site_items)
-                logger.info("%s에서 %d개 URL 수집", site.name, len(site_items))
-            except Exception as e:
-                logger.error("%s 수집 실패: %s", site.name, e)
+        async def _fetch(site: TargetSite) -> list[CollectedItem]:
+            if site.type == "rss":
+                return await self._fetch_from_rss(site)
+            async with html_slots:
+                return await self._fetch_from_html(site)
+
+        results = await asyncio.gather(
+            *(_fetch(site) for site in self.target_sites),
+            return_exceptions=True,
+        )
+
+        for site, result in zip(self.target_sites, results):
+            if isinstance(result, BaseException):
+                logger.error("%s 수집 실패: %s", site.name, result)
+                continue
+            items.extend(result)
+            logger.info("%s에서 %d개 URL 수집", site.name, len(result))
 
         logger.info("웹 총 %d개 URL 수집 완료", len(items))
         return items
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """RSS 요청용 공유 HTTP 클라이언트를 반환합니다."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(follow_redirects=True, timeout=30)
+        return self._http
+
     async def _fetch_from_rss(self, site: TargetSite) -> list[CollectedItem]:
-        """RSS 피드에서 최신 게시글을 수집합니다."""
+        """RSS 피드에서 최신 게시글을 수집합니다.
+
+        feed_cache가 있으면 조건부 요청을 보내고, 피드가 바뀌지 않았거나
+        최신 게시글이 지난번과 같으면 빈 리스트를 반환합니다.
+        새 게시글의 피드 상태는 바로 기록하지 않고 pending_feed_states에 보관합니다.
+        (저장 전에 실패하면 다음 실행에서 다시 수집되도록)
+        """
         rss_url = site.rss_url or site.url
-        feed = feedparser.parse(rss_url)
 
-        if feed.bozo and not feed.entries:
-            logger.warning("%s: RSS 파싱 실패 - %s", site.name, feed.bozo_exception)
+        cached = await self.feed_cache.get(rss_url) if self.feed_cache else None
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._get_http().get(rss_url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug("%s: 피드 변경 없음 (304)", site.name)
             return []
+        response.raise_for_status()
 
-        items = []
         # 최신 게시글 1건만 수집
-        for entry in feed.entries[:1]:
-            url = entry.get("link", "")
-            title = entry.get("title", "제목 없음")
-
-            if url:
-                items.append(
-                    CollectedItem(
-                        url=url,
-                        title=title,
-                        source=SourceType.WEB,
-                        source_name=site.name,
-                        collected_at=datetime.now(),
-                    )
-                )
+        entry = await self._parse_latest_entry(site, response.content)
+        if entry is None:
+            return []
 
-        return items
+        url, title = entry
+        if not url:
+            return []
+
+        if self.feed_cache:
+            state = FeedState(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                first_link=url,
+            )
+            if cached and cached.first_link == url:
+                # 이미 저장된 게시글이므로 검증 헤더만 바로 갱신
+                logger.debug("%s: 최신 게시글 변경 없음", site.name)
+                await self.feed_cache.put(rss_url, state)
+                return []
+            self.pending_feed_states[rss_url] = state
+
+        return [
+            CollectedItem(
+                url=url,
+                title=title,
+                source=SourceType.WEB,
+                source_name=site.name,
+                collected_at=datetime.now(),
+            )
+        ]
+
+    async def _parse_latest_entry(
+        self, site: TargetSite, data: bytes
+    ) -> tuple[str, str] | None:
+        """피드 본문에서 첫 번째 게시글의 (링크, 제목)을 추출합니다.
+
+        XML로 파싱할 수 없거나 링크가 있는 게시글을 찾지 못한 피드
+        (기본 네임스페이스의 RSS 2.0, RSS 0.90, guid만 있는 항목 등)는
+        feedparser로 다시 처리합니다.
+        """
+        try:
+            entry = self._parse_first_entry(data)
+        except etree.XMLSyntaxError as e:
+            logger.debug("%s: XML 파싱 실패, feedparser로 재시도 - %s", site.name, e)
+        else:
+            if entry is not None and entry[0]:
+                return entry
+            logger.debug("%s: 게시글 링크를 찾지 못해 feedparser로 재시도", site.name)
+
+        import feedparser
+
+        feed = await asyncio.to_thread(feedparser.parse, data)
+        if feed.bozo and not feed.entries:
+            logger.warning("%s: RSS 파싱 실패 - %s", site.name, feed.bozo_exception)
+            return None
+        if not feed.entries:
+            return None
+
+        entry = feed.entries[0]
+        return entry.get("link", ""), entry.get("title", "제목 없음")
+
+    @staticmethod
+    def _parse_first_entry(data: bytes) -> tuple[str, str] | None:
+        """RSS/Atom XML을 스트리밍 파싱하여 첫 번째 게시글만 읽고 멈춥니다."""
+        events = etree.iterparse(
+            BytesIO(data),
+            events=("end",),
+            tag=FEED_ENTRY_TAGS,
+            resolve_entities=False,
+        )
+        for _, elem in events:
+            link = elem.findtext("link") or elem.findtext(f"{RSS1_NS}link") or ""
+            if not link:
+                # Atom: <link rel="alternate" href="..."/>
+                for atom_link in elem.iterfind(f"{ATOM_NS}link"):
+                    if atom_link.get("rel", "alternate") == "alternate":
+                        link = atom_link.get("href", "")
+                        break
+            title = (
+                elem.findtext("title")
+                or elem.findtext(f"{ATOM_NS}title")
+                or elem.findtext(f"{RSS1_NS}title")
+                or "제목 없음"
+            )
+            return link.strip(), title.strip()
+        return None
 
     async def _fetch_from_html(self, site: TargetSite) -> list[CollectedItem]:
         """Playwright로 HTML 페이지에서 최신 게시글 링크를 추출합니다."""
@@ -72,45 +243,44 @@ class WebCollector:
             logger.warning("%s: CSS 선택자가 설정되지 않았습니다.", site.name)
             return []
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        browser = await self._ensure_browser()
+        page = None
+        try:
             page = await browser.new_page()
+            await page.goto(site.url, wait_until="domcontentloaded", timeout=30000)
+            await page.wait_for_selector(site.selector, timeout=10000)
+
+            # 선택자로 첫 번째 링크의 href/텍스트를 한 번에 추출
+            # (Playwright 선택자 문법을 그대로 쓰도록 locator로 요소를 찾음)
+            data = await page.locator(site.selector).first.evaluate(EXTRACT_LINK_JS)
 
-            try:
-                await page.goto(site.url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_selector(site.selector, timeout=10000)
-
-                # 선택자로 첫 번째 링크 추출
-                element = await page.query_selector(site.selector)
-                if not element:
-                    logger.warning("%s: 선택자에 매칭되는 요소 없음", site.name)
-                    return []
-
-                href = await element.get_attribute("href")
-                title = (await element.inner_text()).strip() or "제목 없음"
-
-                if not href:
-                    logger.warning("%s: href 속성이 없습니다.", site.name)
-                    return []
-
-                # 상대 URL → 절대 URL 변환
-                if href.startswith("/"):
-                    from urllib.parse import urljoin
-
-                    href = urljoin(site.url, href)
-
-                return [
-                    CollectedItem(
-                        url=href,
-                        title=title,
-                        source=SourceType.WEB,
-                        source_name=site.name,
-                        collected_at=datetime.now(),
-                    )
-                ]
-
-            except Exception as e:
-                logger.error("%s 페이지 로드 실패: %s", site.name, e)
+            href = data["href"]
+            title = data["text"] or "제목 없음"
+
+            if not href:
+                logger.warning("%s: href 속성이 없습니다.", site.name)
                 return []
-            finally:
-                await browser.close()
+
+            # 상대 URL → 절대 URL 변환
+            if href.startswith("/"):
+                from urllib.parse import urljoin
+
+                href = urljoin(site.url, href)
+
+            return [
+                CollectedItem(
+                    url=href,
+                    title=title,
+                    source=SourceType.WEB,
+                    source_name=site.name,
+                    collected_at=datetime.now(),
+                )
+            ]
+
+        except Exception as e:
+            logger.error("%s 페이지 로드 실패: %s", site.name, e)
+            return []
+        finally:
+            if page is not None:
+                await page.close()
+            self._active_pages -= 1
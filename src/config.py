@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 from dotenv import load_dotenv
 
+# libyaml이 설치되어 있으면 C 구현 로더 사용
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# 문자열 안의 ${ENV_VAR} 참조
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+@dataclass(slots=True)
 class GmailConfig:
     """Gmail 수집 설정"""
 
@@ -20,7 +28,7 @@ class GmailConfig:
     max_results: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSource:
     """웹 수집 대상 사이트"""
 
@@ -31,7 +39,7 @@ class WebSource:
     selector: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NotebookLMConfig:
     """NotebookLM 자동화 설정"""
 
@@ -39,9 +47,14 @@ class NotebookLMConfig:
     chrome_profile: str = "Default"
     timeout_seconds: int = 300
     retry_count: int = 2
+    max_tabs: int = 2
 
+    def __post_init__(self) -> None:
+        # "~" 확장은 여기서 한 번만 수행
+        self.chrome_user_data_dir = str(Path(self.chrome_user_data_dir).expanduser())
 
-@dataclass
+
+@dataclass(slots=True)
 class TelegramConfig:
     """텔레그램 봇 설정"""
 
@@ -49,7 +62,7 @@ class TelegramConfig:
     channel_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageConfig:
     """저장소 설정"""
 
@@ -58,7 +71,7 @@ class StorageConfig:
     max_age_hours: int = 24
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """전체 애플리케이션 설정"""
 
@@ -74,28 +87,40 @@ class Settings:
         config_path: str = "config/settings.yaml",
         env_path: str = "config/.env",
     ) -> Settings:
-        """설정 파일과 환경 변수를 로드하여 Settings 인스턴스를 생성합니다."""
-        # .env 파일 로드
-        env_file = Path(env_path)
-        if env_file.exists():
-            load_dotenv(env_file)
+        """설정 파일과 환경 변수를 로드하여 Settings 인스턴스를 생성합니다.
 
-        # YAML 설정 파일 로드
+        두 파일이 바뀌지 않았다면(mtime·크기 기준) YAML을 다시 파싱하지 않습니다.
+        환경 변수 치환은 매번 수행하며, 호출마다 새 인스턴스를 반환합니다.
+        """
         config_file = Path(config_path)
-        if not config_file.exists():
+        try:
+            config_stat = config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"설정 파일을 찾을 수 없습니다: {config_path}\n"
                 f"config/settings.example.yaml을 복사하여 생성해 주세요."
-            )
-
-        with open(config_file, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
-
+            ) from None
+
+        try:
+            env_stat = Path(env_path).stat()
+            env_key = (env_stat.st_mtime_ns, env_stat.st_size)
+        except OSError:
+            env_key = None  # .env 파일 없음
+
+        raw = _load_raw(
+            str(config_file.resolve()),
+            (config_stat.st_mtime_ns, config_stat.st_size),
+            env_path,
+            env_key,
+        )
         return cls._from_dict(raw)
 
     @classmethod
     def _from_dict(cls, raw: dict) -> Settings:
         """딕셔너리에서 Settings 인스턴스를 생성합니다."""
+        # 모든 문자열 값에 환경 변수 치환을 한 번에 적용
+        raw = cls._resolve_env_tree(raw)
+
         gmail_raw = raw.get("gmail", {})
         gmail = GmailConfig(
             credentials_path=gmail_raw.get(
@@ -126,12 +151,13 @@ class Settings:
             chrome_profile=nlm_raw.get("chrome_profile", "Default"),
             timeout_seconds=nlm_raw.get("timeout_seconds", 300),
             retry_count=nlm_raw.get("retry_count", 2),
+            max_tabs=nlm_raw.get("max_tabs", 2),
         )
 
         tg_raw = raw.get("telegram", {})
         telegram = TelegramConfig(
-            bot_token=cls._resolve_env(tg_raw.get("bot_token", "")),
-            channel_id=cls._resolve_env(tg_raw.get("channel_id", "")),
+            bot_token=tg_raw.get("bot_token", ""),
+            channel_id=tg_raw.get("channel_id", ""),
         )
 
         st_raw = raw.get("storage", {})
@@ -151,11 +177,23 @@ class Settings:
 
     @staticmethod
     def _resolve_env(value: str) -> str:
-        """${ENV_VAR} 형식의 값을 환경 변수로 치환합니다."""
-        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            env_key = value[2:-1]
-            return os.getenv(env_key, "")
-        return value
+        """문자열 안의 ${ENV_VAR} 참조를 환경 변수 값으로 치환합니다.
+
+        설정되지 않은 환경 변수는 빈 문자열로 치환됩니다.
+        """
+        # 대부분의 값에는 참조가 없으므로 정규식 전에 부분 문자열로 먼저 확인
+        if not isinstance(value, str) or "${" not in value:
+            return value
+        return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), ""), value)
+
+    @classmethod
+    def _resolve_env_tree(cls, value):
+        """YAML 트리를 순회하며 모든 문자열 값에 _resolve_env를 적용합니다."""
+        if isinstance(value, dict):
+            return {k: cls._resolve_env_tree(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls._resolve_env_tree(v) for v in value]
+        return cls._resolve_env(value)
 
     def validate(self) -> list[str]:
         """설정 값의 유효성을 검사하고 경고 메시지 리스트를 반환합니다."""
@@ -170,16 +208,42 @@ class Settings:
         if not self.telegram.channel_id:
             warnings.append("텔레그램 채널 ID가 설정되지 않았습니다.")
 
-        credentials = Path(self.gmail.credentials_path)
-        if not credentials.exists():
+        # 검사할 경로의 존재 여부를 한 번에 확인
+        paths = {
+            "credentials": Path(self.gmail.credentials_path),
+            "chrome": Path(self.notebooklm.chrome_user_data_dir),
+        }
+        exists = {key: path.exists() for key, path in paths.items()}
+
+        if not exists["credentials"]:
             warnings.append(
                 f"Gmail 인증 파일을 찾을 수 없습니다: {self.gmail.credentials_path}"
             )
 
-        chrome_dir = Path(self.notebooklm.chrome_user_data_dir).expanduser()
-        if not chrome_dir.exists():
+        if not exists["chrome"]:
             warnings.append(
-                f"크롬 User Data Directory를 찾을 수 없습니다: {chrome_dir}"
+                f"크롬 User Data Directory를 찾을 수 없습니다: {paths['chrome']}"
             )
 
         return warnings
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raw(
+    config_path: str,
+    config_key: tuple[int, int],
+    env_path: str,
+    env_key: tuple[int, int] | None,
+) -> dict:
+    """.env와 YAML 설정 파일을 읽습니다.
+
+    경로와 (mtime, 크기)가 같으면 캐시를 사용하며,
+    반환한 딕셔너리는 캐시에 공유되므로 수정하지 않습니다.
+    """
+    # .env 파일 로드
+    if env_key is not None:
+        load_dotenv(env_path)
+
+    # YAML 설정 파일 로드
+    # 파일을 한 번에 읽어 전달 (로더가 스트림을 청크 단위로 읽지 않도록)
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER) or {}
@@ -0,0 +1,83 @@
+"""피드 캐시 - RSS 조건부 요청(ETag/Last-Modified)을 위한 피드 상태 저장소"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import aiosqlite
+
+from src.logger import get_logger
+
+logger = get_logger("database.feed_cache")
+
+CREATE_FEED_CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS feed_cache (
+    feed_url      TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    first_link    TEXT,
+    updated_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+@dataclass
+class FeedState:
+    """마지막으로 받은 피드의 검증 헤더와 최신 게시글 링크"""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    first_link: str | None = None
+
+
+class FeedCache:
+    """피드 URL별 마지막 응답 상태를 저장합니다."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._db: aiosqlite.Connection | None = None
+
+    async def initialize(self) -> None:
+        """데이터베이스 연결 및 테이블 생성"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = await aiosqlite.connect(self.db_path)
+        await self._db.executescript(CREATE_FEED_CACHE_SQL)
+        await self._db.commit()
+
+    async def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        if self._db:
+            await self._db.close()
+            self._db = None
+
+    async def get(self, feed_url: str) -> FeedState | None:
+        """피드의 마지막 상태를 반환합니다. (없으면 None)"""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        cursor = await self._db.execute(
+            "SELECT etag, last_modified, first_link FROM feed_cache WHERE feed_url = ?",
+            (feed_url,),
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        return FeedState(etag=row[0], last_modified=row[1], first_link=row[2])
+
+    async def put(self, feed_url: str, state: FeedState) -> None:
+        """피드 상태를 저장합니다. (기존 상태는 덮어씀)"""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        await self._db.execute(
+            """
+            INSERT INTO feed_cache (feed_url, etag, last_modified, first_link)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(feed_url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                first_link = excluded.first_link,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (feed_url, state.etag, state.last_modified, state.first_link),
+        )
+        await self._db.commit()
+        logger.debug("피드 상태 저장: %s", feed_url)
@@ -2,37 +2,122 @@
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Final
 
 import aiosqlite
 
 from src.logger import get_logger
-from src.models import CollectedItem, ProcessingStatus, SourceType
+from src.models import (
+    SOURCE_BY_VALUE,
+    STATUS_BY_VALUE,
+    CollectedItem,
+    ProcessingStatus,
+)
 
 logger = get_logger("database")
 
-CREATE_TABLE_SQL = """
-CREATE TABLE IF NOT EXISTS processed_urls (
+# url 컬럼의 UNIQUE 제약이 자동 인덱스를 만들므로 별도 해시 컬럼은 두지 않음
+PROCESSED_URLS_COLUMNS = """
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
     url          TEXT NOT NULL UNIQUE,
-    url_hash     TEXT NOT NULL UNIQUE,
     title        TEXT,
     source       TEXT NOT NULL,
     source_name  TEXT,
     status       TEXT DEFAULT 'pending',
     error_msg    TEXT,
     audio_path   TEXT,
-    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    collected_at INTEGER NOT NULL,  -- Unix epoch (ms)
     completed_at TIMESTAMP,
     created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+"""
+
+CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS processed_urls ({PROCESSED_URLS_COLUMNS});
 
-CREATE INDEX IF NOT EXISTS idx_url_hash ON processed_urls(url_hash);
 CREATE INDEX IF NOT EXISTS idx_status ON processed_urls(status);
+CREATE INDEX IF NOT EXISTS idx_collected_at ON processed_urls(collected_at);
+-- PENDING 항목만 담는 부분 인덱스 (테이블이 커져도 대기 항목 수에 비례해 조회)
+CREATE INDEX IF NOT EXISTS idx_pending ON processed_urls(collected_at)
+    WHERE status = 'pending';
 """
 
+# 이전 스키마(url_hash 컬럼, ISO 텍스트 collected_at)의 테이블을 새 스키마로 옮김
+# collected_at은 로컬 시각으로 저장되어 있었으므로 'utc' 수정자로 UTC 기준 ms로 변환
+MIGRATE_LEGACY_SQL = f"""
+BEGIN;
+CREATE TABLE processed_urls_new ({PROCESSED_URLS_COLUMNS});
+INSERT INTO processed_urls_new (
+    id, url, title, source, source_name, status, error_msg, audio_path,
+    collected_at, completed_at, created_at
+)
+SELECT
+    id, url, title, source, source_name, status, error_msg, audio_path,
+    CAST(ROUND(
+        (julianday(COALESCE(collected_at, created_at, 'now'), 'utc') - 2440587.5)
+        * 86400000
+    ) AS INTEGER),
+    completed_at, created_at
+FROM processed_urls;
+DROP TABLE processed_urls;
+ALTER TABLE processed_urls_new RENAME TO processed_urls;
+COMMIT;
+"""
+
+# 자주 쓰는 쿼리는 모듈 상수로 두어 매 호출 같은 문자열을 재사용
+# (sqlite3 연결의 prepared statement 캐시는 SQL 문자열 기준)
+INSERT_SQL: Final = (
+    "INSERT INTO processed_urls"
+    " (url, title, source, source_name, status, collected_at)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+# url UNIQUE 자동 인덱스를 한 번 탐색하고 첫 일치에서 종료
+IS_DUPLICATE_SQL: Final = (
+    "SELECT EXISTS (SELECT 1 FROM processed_urls WHERE url = ? LIMIT 1)"
+)
+UPDATE_STATUS_SQL: Final = (
+    "UPDATE processed_urls"
+    " SET status = ?, error_msg = ?, audio_path = ?, completed_at = ?"
+    " WHERE id = ?"
+)
+# _row_to_item이 위치로 읽는 컬럼 순서
+ITEM_COLUMNS: Final = (
+    "id, url, title, source, source_name, status, error_msg, audio_path, collected_at"
+)
+# 부분 인덱스(idx_pending)를 쓰려면 WHERE 조건이 리터럴로 일치해야 함
+# 통계가 없으면 플래너가 idx_status + 정렬을 고르므로 INDEXED BY로 지정
+# LIMIT -1은 제한 없음
+SELECT_PENDING_SQL: Final = (
+    f"SELECT {ITEM_COLUMNS} FROM processed_urls INDEXED BY idx_pending"
+    " WHERE status = 'pending' ORDER BY collected_at LIMIT ?"
+)
+SELECT_COMPLETED_SQL: Final = (
+    f"SELECT {ITEM_COLUMNS} FROM processed_urls"
+    " WHERE status = ? AND audio_path IS NOT NULL ORDER BY collected_at"
+)
+RECENT_COUNT_SQL: Final = "SELECT COUNT(*) FROM processed_urls WHERE collected_at >= ?"
+
+# 연결 직후 적용하는 PRAGMA (단일 writer 워크로드 기준)
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 약 64MB
+    "PRAGMA mmap_size=268435456",  # 256MB
+)
+
+# commit=False로 미룬 상태 업데이트를 이 개수마다 커밋
+STATUS_COMMIT_EVERY = 8
+
+# 한 쿼리에 바인딩할 최대 파라미터 수 (SQLite 기본 한도 999 이하)
+MAX_SQL_PARAMS = 900
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    """datetime을 collected_at 컬럼 형식(Unix epoch ms)으로 변환합니다."""
+    return int(value.timestamp() * 1000)
+
 
 class URLRepository:
     """URL 저장소 - 중복 체크 및 상태 관리"""
@@ -40,95 +125,158 @@ class URLRepository:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         self._db: aiosqlite.Connection | None = None
+        # 아직 커밋하지 않은 상태 업데이트 수
+        self._dirty = 0
 
     async def initialize(self) -> None:
         """데이터베이스 연결 및 테이블 생성"""
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
 
-        self._db = await aiosqlite.connect(self.db_path)
-        self._db.row_factory = aiosqlite.Row
+        self._db = await aiosqlite.connect(
+            self.db_path,
+            # IN (?, ...) 쿼리는 파라미터 개수마다 문장이 달라지므로 캐시를 넉넉히
+            cached_statements=256,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            await self._db.execute(pragma)
+        await self._migrate()
         await self._db.executescript(CREATE_TABLE_SQL)
         await self._db.commit()
         logger.info("데이터베이스 초기화 완료: %s", self.db_path)
 
+    async def _migrate(self) -> None:
+        """이전 버전 스키마의 테이블을 현재 스키마로 변환합니다."""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        cursor = await self._db.execute("PRAGMA table_info(processed_urls)")
+        # table_info 행: (cid, name, type, notnull, dflt_value, pk)
+        columns = {row[1]: row[2] for row in await cursor.fetchall()}
+        if columns and columns.get("collected_at") != "INTEGER":
+            await self._db.executescript(MIGRATE_LEGACY_SQL)
+            logger.info("processed_urls 테이블을 현재 스키마로 변환 완료")
+
     async def close(self) -> None:
         """데이터베이스 연결 종료"""
         if self._db:
+            await self.flush()
             await self._db.close()
             self._db = None
 
-    @staticmethod
-    def _hash_url(url: str) -> str:
-        """URL의 SHA-256 해시를 생성합니다."""
-        return hashlib.sha256(url.encode("utf-8")).hexdigest()
-
     async def is_duplicate(self, url: str) -> bool:
         """URL이 이미 DB에 존재하는지 확인합니다."""
         assert self._db is not None, "DB가 초기화되지 않았습니다."
-        url_hash = self._hash_url(url)
-        cursor = await self._db.execute(
-            "SELECT 1 FROM processed_urls WHERE url_hash = ?",
-            (url_hash,),
+        cursor = await self._db.execute(IS_DUPLICATE_SQL, (url,))
+        (exists,) = await cursor.fetchone()
+        return bool(exists)
+
+    async def filter_new(self, urls: list[str]) -> set[str]:
+        """DB에 아직 없는 URL의 집합을 반환합니다."""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        candidates = list(dict.fromkeys(urls))
+        existing: set[str] = set()
+        for start in range(0, len(candidates), MAX_SQL_PARAMS):
+            chunk = candidates[start : start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await self._db.execute(
+                f"SELECT url FROM processed_urls WHERE url IN ({placeholders})",
+                chunk,
+            )
+            existing.update(row[0] for row in await cursor.fetchall())
+        return set(candidates) - existing
+
+    @staticmethod
+    def _item_row(item: CollectedItem) -> tuple:
+        """INSERT_SQL에 바인딩할 값을 만듭니다."""
+        return (
+            item.url,
+            item.title,
+            item.source.value,
+            item.source_name,
+            item.status.value,
+            _to_epoch_ms(item.collected_at),
         )
-        row = await cursor.fetchone()
-        return row is not None
 
     async def save(self, item: CollectedItem) -> int:
-        """수집된 항목을 DB에 저장하고 ID를 반환합니다."""
+        """수집된 항목을 DB에 저장하고 ID를 반환합니다.
+
+        이미 저장된 URL이면 sqlite3.IntegrityError가 그대로 전파됩니다.
+        """
         assert self._db is not None, "DB가 초기화되지 않았습니다."
-        url_hash = self._hash_url(item.url)
-        cursor = await self._db.execute(
-            """
-            INSERT INTO processed_urls (url, url_hash, title, source, source_name, status, collected_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                item.url,
-                url_hash,
-                item.title,
-                item.source.value,
-                item.source_name,
-                item.status.value,
-                item.collected_at.isoformat(),
-            ),
-        )
+        cursor = await self._db.execute(INSERT_SQL, self._item_row(item))
         await self._db.commit()
         item_id = cursor.lastrowid
         logger.info("URL 저장 완료 (id=%d): %s", item_id, item.url)
         return item_id
 
+    async def save_many(self, items: list[CollectedItem]) -> list[int]:
+        """여러 항목을 한 트랜잭션으로 저장하고 입력 순서대로 ID를 반환합니다."""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        if not items:
+            return []
+
+        rows = [self._item_row(item) for item in items]
+        # 실패 시 rollback이 미뤄 둔 상태 업데이트까지 버리지 않도록 먼저 커밋
+        await self.flush()
+        try:
+            await self._db.executemany(INSERT_SQL, rows)
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        # executemany는 행별 lastrowid를 주지 않으므로 URL로 다시 조회
+        urls = [item.url for item in items]
+        ids: dict[str, int] = {}
+        for start in range(0, len(urls), MAX_SQL_PARAMS):
+            chunk = urls[start : start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await self._db.execute(
+                f"SELECT url, id FROM processed_urls WHERE url IN ({placeholders})",
+                chunk,
+            )
+            ids.update((row[0], row[1]) for row in await cursor.fetchall())
+        await self._db.commit()
+
+        logger.info("URL %d개 저장 완료", len(items))
+        return [ids[url] for url in urls]
+
     async def update_status(
         self,
         url_id: int,
         status: ProcessingStatus,
         error_msg: str | None = None,
         audio_path: str | None = None,
+        commit: bool = True,
     ) -> None:
-        """URL의 처리 상태를 업데이트합니다."""
+        """URL의 처리 상태를 업데이트합니다.
+
+        commit=False이면 커밋을 미루고 STATUS_COMMIT_EVERY건마다, 또는
+        flush() 호출 시 한 번에 커밋합니다.
+        """
         assert self._db is not None, "DB가 초기화되지 않았습니다."
         completed_at = (
-            datetime.now().isoformat()
-            if status == ProcessingStatus.COMPLETED
-            else None
+            datetime.now().isoformat() if status == ProcessingStatus.COMPLETED else None
         )
         await self._db.execute(
-            """
-            UPDATE processed_urls
-            SET status = ?, error_msg = ?, audio_path = ?, completed_at = ?
-            WHERE id = ?
-            """,
+            UPDATE_STATUS_SQL,
             (status.value, error_msg, audio_path, completed_at, url_id),
         )
-        await self._db.commit()
+        self._dirty += 1
+        if commit or self._dirty >= STATUS_COMMIT_EVERY:
+            await self.flush()
         logger.info("상태 업데이트 (id=%d): %s", url_id, status.value)
 
-    async def get_pending(self) -> list[CollectedItem]:
-        """PENDING 상태의 모든 항목을 반환합니다."""
+    async def flush(self) -> None:
+        """미뤄 둔 상태 업데이트를 커밋합니다."""
+        assert self._db is not None, "DB가 초기화되지 않았습니다."
+        if self._dirty:
+            await self._db.commit()
+            self._dirty = 0
+
+    async def get_pending(self, limit: int | None = None) -> list[CollectedItem]:
+        """PENDING 상태의 항목을 수집 시각 순으로 반환합니다. (limit: 최대 개수)"""
         assert self._db is not None, "DB가 초기화되지 않았습니다."
         cursor = await self._db.execute(
-            "SELECT * FROM processed_urls WHERE status = ? ORDER BY collected_at",
-            (ProcessingStatus.PENDING.value,),
+            SELECT_PENDING_SQL, (-1 if limit is None else limit,)
         )
         rows = await cursor.fetchall()
         return [self._row_to_item(row) for row in rows]
@@ -137,8 +285,7 @@ class URLRepository:
         """COMPLETED 상태이지만 아직 전달되지 않은 항목을 반환합니다."""
         assert self._db is not None, "DB가 초기화되지 않았습니다."
         cursor = await self._db.execute(
-            "SELECT * FROM processed_urls WHERE status = ? AND audio_path IS NOT NULL ORDER BY collected_at",
-            (ProcessingStatus.COMPLETED.value,),
+            SELECT_COMPLETED_SQL, (ProcessingStatus.COMPLETED.value,)
         )
         rows = await cursor.fetchall()
         return [self._row_to_item(row) for row in rows]
@@ -146,25 +293,33 @@ class URLRepository:
     async def get_recent_count(self, hours: int = 24) -> int:
         """최근 N시간 이내에 수집된 항목 수를 반환합니다."""
         assert self._db is not None, "DB가 초기화되지 않았습니다."
-        since = (datetime.now() - timedelta(hours=hours)).isoformat()
-        cursor = await self._db.execute(
-            "SELECT COUNT(*) FROM processed_urls WHERE collected_at >= ?",
-            (since,),
-        )
+        since = _to_epoch_ms(datetime.now() - timedelta(hours=hours))
+        cursor = await self._db.execute(RECENT_COUNT_SQL, (since,))
         row = await cursor.fetchone()
         return row[0] if row else 0
 
     @staticmethod
-    def _row_to_item(row: aiosqlite.Row) -> CollectedItem:
-        """DB 행을 CollectedItem으로 변환합니다."""
+    def _row_to_item(row: tuple) -> CollectedItem:
+        """DB 행(ITEM_COLUMNS 순서)을 CollectedItem으로 변환합니다."""
+        (
+            item_id,
+            url,
+            title,
+            source,
+            source_name,
+            status,
+            error_msg,
+            audio_path,
+            collected_at,
+        ) = row
         return CollectedItem(
-            id=row["id"],
-            url=row["url"],
-            title=row["title"] or "",
-            source=SourceType(row["source"]),
-            source_name=row["source_name"] or "",
-            status=ProcessingStatus(row["status"]),
-            error_msg=row["error_msg"],
-            audio_path=row["audio_path"],
-            collected_at=datetime.fromisoformat(row["collected_at"]),
+            id=item_id,
+            url=url,
+            title=title or "",
+            source=SOURCE_BY_VALUE[source],
+            source_name=source_name or "",
+            status=STATUS_BY_VALUE[status],
+            error_msg=error_msg,
+            audio_path=audio_path,
+            collected_at=datetime.fromtimestamp(collected_at / 1000),
         )
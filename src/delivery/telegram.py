@@ -27,6 +27,21 @@ class TelegramDelivery:
         self.max_retries = max_retries
         self._bot: Bot | None = None
 
+    async def initialize(self) -> None:
+        """Bot을 만들고 HTTP 연결을 미리 열어 둡니다."""
+        try:
+            await self._get_bot().initialize()
+        except TelegramError as e:
+            # 토큰 오류(InvalidToken)도 TelegramError에 포함됨
+            # 연결은 전송 시점에 다시 시도되므로 경고만 남김
+            logger.warning("텔레그램 봇 초기화 실패: %s", e)
+
+    async def close(self) -> None:
+        """Bot의 HTTP 연결을 닫습니다."""
+        if self._bot:
+            await self._bot.shutdown()
+            self._bot = None
+
     def _get_bot(self) -> Bot:
         """Bot 인스턴스를 반환합니다."""
         if self._bot is None:
@@ -55,18 +70,20 @@ class TelegramDelivery:
 
         bot = self._get_bot()
         caption = f"🎧 {title}\n\n📎 원문: {source_url}"
+        # 큰 파일 읽기가 이벤트 루프를 막지 않도록 스레드에서 한 번만 읽음
+        audio_data = await asyncio.to_thread(file_path.read_bytes)
 
         for attempt in range(self.max_retries):
             try:
-                with open(file_path, "rb") as audio_file:
-                    await bot.send_audio(
-                        chat_id=self.channel_id,
-                        audio=audio_file,
-                        caption=caption,
-                        title=title,
-                        read_timeout=60,
-                        write_timeout=60,
-                    )
+                await bot.send_audio(
+                    chat_id=self.channel_id,
+                    audio=audio_data,
+                    filename=file_path.name,
+                    caption=caption,
+                    title=title,
+                    read_timeout=60,
+                    write_timeout=60,
+                )
                 logger.info("텔레그램 전송 완료: %s", title)
                 return True
 
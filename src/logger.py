@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# 로그 파일 최대 크기와 보관 개수
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
+
+# 프로세스당 하나만 두는 로그 큐와 리스너 (setup_logger 최초 호출 시 생성)
+_log_queue: queue.SimpleQueue[logging.LogRecord] | None = None
+_listener: QueueListener | None = None
+
 
 def setup_logger(
     name: str = "lettercast",
@@ -30,6 +41,12 @@ def setup_logger(
 
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    global _log_queue, _listener
+    if _listener is not None:
+        # 이미 실행 중인 리스너(최초 설정의 콘솔/파일 핸들러)를 공유
+        logger.addHandler(QueueHandler(_log_queue))
+        return logger
+
     # 포맷터: 2026-02-27 08:00:05 | INFO | module | message
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)-7s | %(name)-20s | %(message)s",
@@ -39,18 +56,30 @@ def setup_logger(
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
-    # 파일 핸들러 (log_dir이 지정된 경우)
+    # 파일 핸들러 (log_dir이 지정된 경우, 첫 기록 시 파일을 열고 크기 초과 시 교체)
     if log_dir:
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(
+        file_handler = RotatingFileHandler(
             log_path / "lettercast.log",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # 메시지 포맷팅은 호출 스레드에서(QueueHandler.prepare), 콘솔/파일 출력은
+    # 백그라운드 스레드에서 처리
+    _log_queue = queue.SimpleQueue()
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # 종료 시 큐에 남은 로그를 모두 출력
+    atexit.register(_listener.stop)
+    logger.addHandler(QueueHandler(_log_queue))
 
     return logger
 
@@ -10,20 +10,26 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.automator.notebooklm import NotebookLMAutomator
-from src.collector.gmail_collector import GmailCollector
-from src.collector.web_collector import WebCollector
 from src.config import Settings
+from src.database.feed_cache import FeedCache, FeedState
 from src.database.repository import URLRepository
-from src.delivery.telegram import TelegramDelivery
 from src.logger import get_logger, setup_logger
 from src.models import CollectedItem, ProcessingStatus, TargetSite
 
+# Playwright, googleapiclient, telegram 등 무거운 의존성은 해당 단계에서 import
+if TYPE_CHECKING:
+    from src.delivery.telegram import TelegramDelivery
+
 logger = get_logger("main")
 
+# 텔레그램 동시 업로드 수
+MAX_CONCURRENT_SENDS = 3
+
 
 class LetterCastPipeline:
     """전체 파이프라인 오케스트레이터"""
@@ -32,12 +38,32 @@ class LetterCastPipeline:
         self.settings = settings
         self.dry_run = dry_run
         self.repo: URLRepository | None = None
+        self.feed_cache: FeedCache | None = None
+        self.delivery: TelegramDelivery | None = None
+        # 수집 항목이 저장된 뒤에 기록할 RSS 피드 상태
+        self._pending_feed_states: dict[str, FeedState] = {}
+        # 설정의 웹 소스는 실행 중 바뀌지 않으므로 한 번만 변환
+        self._target_sites = [
+            TargetSite(
+                name=ws.name,
+                url=ws.url,
+                type=ws.type,
+                rss_url=ws.rss_url,
+                selector=ws.selector,
+            )
+            for ws in settings.web_sources
+        ]
 
     async def initialize(self) -> None:
         """리소스 초기화"""
         self.repo = URLRepository(self.settings.storage.db_path)
         await self.repo.initialize()
 
+        # dry-run은 다음 실행에 영향을 주지 않도록 피드 캐시를 사용하지 않음
+        if not self.dry_run:
+            self.feed_cache = FeedCache(self.settings.storage.db_path)
+            await self.feed_cache.initialize()
+
         # 임시 오디오 디렉토리 생성
         Path(self.settings.storage.temp_audio_dir).mkdir(parents=True, exist_ok=True)
 
@@ -45,48 +71,57 @@ class LetterCastPipeline:
         """리소스 정리"""
         if self.repo:
             await self.repo.close()
+        if self.feed_cache:
+            await self.feed_cache.close()
+        if self.delivery:
+            await self.delivery.close()
 
     # ──────────────────────────────────────────────
     # Phase 1: 수집
     # ──────────────────────────────────────────────
     async def collect(self) -> list[CollectedItem]:
-        """모든 소스에서 URL을 수집합니다."""
+        """모든 소스에서 URL을 수집합니다. (Gmail과 웹을 동시에 수집)"""
         logger.info("═══ Phase 1: 수집 시작 ═══")
-        all_items: list[CollectedItem] = []
+        gmail_items, web_items = await asyncio.gather(
+            self._collect_gmail(), self._collect_web()
+        )
+        all_items = gmail_items + web_items
+
+        logger.info("수집 완료: 총 %d개 URL", len(all_items))
+        return all_items
 
-        # Gmail 수집
+    async def _collect_gmail(self) -> list[CollectedItem]:
+        """Gmail에서 URL을 수집합니다. 실패 시 빈 리스트를 반환합니다."""
         try:
+            from src.collector.gmail_collector import GmailCollector
+
             gmail_collector = GmailCollector(
                 credentials_path=self.settings.gmail.credentials_path,
                 token_path=self.settings.gmail.token_path,
                 allowed_senders=self.settings.gmail.allowed_senders,
                 max_results=self.settings.gmail.max_results,
             )
-            gmail_items = await gmail_collector.fetch_unread_urls()
-            all_items.extend(gmail_items)
+            return await gmail_collector.fetch_unread_urls()
         except Exception as e:
             logger.error("Gmail 수집 실패: %s", e)
+            return []
 
-        # 웹 수집
+    async def _collect_web(self) -> list[CollectedItem]:
+        """웹 사이트에서 URL을 수집합니다. 실패 시 빈 리스트를 반환합니다."""
         try:
-            target_sites = [
-                TargetSite(
-                    name=ws.name,
-                    url=ws.url,
-                    type=ws.type,
-                    rss_url=ws.rss_url,
-                    selector=ws.selector,
-                )
-                for ws in self.settings.web_sources
-            ]
-            web_collector = WebCollector(target_sites=target_sites)
-            web_items = await web_collector.fetch_latest_urls()
-            all_items.extend(web_items)
+            from src.collector.web_collector import WebCollector
+
+            web_collector = WebCollector(
+                target_sites=self._target_sites, feed_cache=self.feed_cache
+            )
+            try:
+                return await web_collector.fetch_latest_urls()
+            finally:
+                self._pending_feed_states.update(web_collector.pending_feed_states)
+                await web_collector.close()
         except Exception as e:
             logger.error("웹 수집 실패: %s", e)
-
-        logger.info("수집 완료: 총 %d개 URL", len(all_items))
-        return all_items
+            return []
 
     # ──────────────────────────────────────────────
     # Phase 2: 필터링 (중복 제거)
@@ -99,24 +134,37 @@ class LetterCastPipeline:
 
         logger.info("═══ Phase 2: 필터링 시작 ═══")
         new_items: list[CollectedItem] = []
+        new_urls = await self.repo.filter_new([item.url for item in items])
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for item in items:
-            if await self.repo.is_duplicate(item.url):
-                logger.debug("중복 스킵: %s", item.url)
+            if item.url not in new_urls:
+                if debug_enabled:
+                    logger.debug("중복 스킵: %s", item.url)
                 continue
+            # 같은 배치 안의 중복은 첫 항목만 사용
+            new_urls.discard(item.url)
 
             if self.dry_run:
                 logger.info("[DRY-RUN] 신규 URL: %s", item.url)
-                new_items.append(item)
-                continue
-
-            item_id = await self.repo.save(item)
-            item.id = item_id
             new_items.append(item)
 
+        if not self.dry_run:
+            item_ids = await self.repo.save_many(new_items)
+            for item, item_id in zip(new_items, item_ids):
+                item.id = item_id
+            await self._save_feed_states()
+
         logger.info("필터링 완료: %d개 신규 / %d개 전체", len(new_items), len(items))
         return new_items
 
+    async def _save_feed_states(self) -> None:
+        """수집 항목이 저장된 뒤 보류 중인 RSS 피드 상태를 기록합니다."""
+        if self.feed_cache:
+            for feed_url, state in self._pending_feed_states.items():
+                await self.feed_cache.put(feed_url, state)
+        self._pending_feed_states.clear()
+
     # ──────────────────────────────────────────────
     # Phase 3: 오디오 생성
     # ──────────────────────────────────────────────
@@ -134,58 +182,67 @@ class LetterCastPipeline:
 
         logger.info("═══ Phase 3: 오디오 생성 시작 (%d건) ═══", len(items))
 
+        from src.automator.notebooklm import NotebookLMAutomator
+
         automator = NotebookLMAutomator(
             chrome_user_data_dir=self.settings.notebooklm.chrome_user_data_dir,
             chrome_profile=self.settings.notebooklm.chrome_profile,
             timeout_seconds=self.settings.notebooklm.timeout_seconds,
             retry_count=self.settings.notebooklm.retry_count,
+            max_tabs=self.settings.notebooklm.max_tabs,
         )
 
-        completed: list[CollectedItem] = []
-
-        try:
-            await automator.start_session()
+        for item in items:
+            if item.id:
+                await self.repo.update_status(
+                    item.id, ProcessingStatus.PROCESSING, commit=False
+                )
+        await self.repo.flush()
 
-            for i, item in enumerate(items, 1):
-                logger.info("오디오 생성 (%d/%d): %s", i, len(items), item.title)
+        finished: set[int] = set()
+        succeeded: list[int] = []
 
-                if item.id:
-                    await self.repo.update_status(item.id, ProcessingStatus.PROCESSING)
+        async def _on_result(i: int, audio_path: Path | None) -> None:
+            """워커가 끝나는 즉시 결과를 저장해 배치가 중단돼도 유실되지 않게 합니다."""
+            finished.add(i)
+            item = items[i]
+            if not item.id:
+                return
+            if audio_path:
+                item.audio_path = str(audio_path)
+                await self.repo.update_status(
+                    item.id,
+                    ProcessingStatus.COMPLETED,
+                    audio_path=str(audio_path),
+                )
+                succeeded.append(i)
+            else:
+                logger.error("오디오 생성 실패: %s", item.url)
+                await self.repo.update_status(
+                    item.id,
+                    ProcessingStatus.FAILED,
+                    error_msg="오디오 생성 실패",
+                )
 
-                try:
-                    audio_path = await automator.process_url(
-                        url=item.url,
-                        title=item.title,
-                        save_dir=self.settings.storage.temp_audio_dir,
+        # 브라우저 세션 하나의 탭 풀로 전체 URL을 동시 처리
+        try:
+            await automator.run_batch(
+                [(item.url, item.title) for item in items],
+                save_dir=self.settings.storage.temp_audio_dir,
+                on_result=_on_result,
+            )
+        except Exception as e:
+            # 처리되지 못한 항목이 PROCESSING에 남지 않도록 실패로 기록
+            logger.error("오디오 배치 처리 중단: %s", e)
+            for i, item in enumerate(items):
+                if i not in finished and item.id:
+                    await self.repo.update_status(
+                        item.id, ProcessingStatus.FAILED, error_msg=str(e), commit=False
                     )
+            await self.repo.flush()
 
-                    if audio_path and item.id:
-                        item.audio_path = str(audio_path)
-                        await self.repo.update_status(
-                            item.id,
-                            ProcessingStatus.COMPLETED,
-                            audio_path=str(audio_path),
-                        )
-                        completed.append(item)
-                    elif item.id:
-                        await self.repo.update_status(
-                            item.id,
-                            ProcessingStatus.FAILED,
-                            error_msg="오디오 생성 실패",
-                        )
-
-                except Exception as e:
-                    logger.error("오디오 생성 실패: %s - %s", item.url, e)
-                    if item.id:
-                        await self.repo.update_status(
-                            item.id,
-                            ProcessingStatus.FAILED,
-                            error_msg=str(e),
-                        )
-
-        finally:
-            await automator.close_session()
-
+        # 완료 순서가 아닌 입력 순서로 반환
+        completed = [items[i] for i in sorted(succeeded)]
         logger.info("오디오 생성 완료: %d/%d 성공", len(completed), len(items))
         return completed
 
@@ -203,35 +260,59 @@ class LetterCastPipeline:
             return len(items)
 
         logger.info("═══ Phase 4: 전달 시작 (%d건) ═══", len(items))
+        delivery = await self._get_delivery()
 
-        delivery = TelegramDelivery(
-            bot_token=self.settings.telegram.bot_token,
-            channel_id=self.settings.telegram.channel_id,
-        )
-
-        success_count = 0
-        for item in items:
-            if not item.audio_path:
-                continue
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
 
+        async def _send_one(item: CollectedItem) -> bool:
             audio_path = Path(item.audio_path)
-            success = await delivery.send_audio(
-                file_path=audio_path,
-                title=item.title,
-                source_url=item.url,
-            )
+            async with semaphore:
+                success = await delivery.send_audio(
+                    file_path=audio_path,
+                    title=item.title,
+                    source_url=item.url,
+                )
 
             if success:
-                success_count += 1
                 # 전송 완료 후 임시 파일 삭제
                 try:
                     audio_path.unlink(missing_ok=True)
                 except Exception:
                     pass
+            return success
+
+        sendable = [item for item in items if item.audio_path]
+        results = await asyncio.gather(
+            *(_send_one(item) for item in sendable),
+            return_exceptions=True,
+        )
+
+        success_count = 0
+        for item, result in zip(sendable, results):
+            if isinstance(result, BaseException):
+                logger.error("전달 실패 (%s): %s", item.url, result)
+            elif result:
+                success_count += 1
 
         logger.info("전달 완료: %d/%d 성공", success_count, len(items))
         return success_count
 
+    async def _get_delivery(self) -> TelegramDelivery:
+        """전달 단계에서 처음 호출될 때 텔레그램 봇을 만들고 연결합니다.
+
+        수집만 하는 실행에서는 텔레그램 설정 없이도 동작하도록 지연 생성합니다.
+        """
+        if self.delivery is None:
+            from src.delivery.telegram import TelegramDelivery
+
+            # 전송마다 연결을 새로 맺지 않도록 봇 하나를 재사용
+            self.delivery = TelegramDelivery(
+                bot_token=self.settings.telegram.bot_token,
+                channel_id=self.settings.telegram.channel_id,
+            )
+            await self.delivery.initialize()
+        return self.delivery
+
     # ──────────────────────────────────────────────
     # 전체 파이프라인
     # ──────────────────────────────────────────────
@@ -23,7 +23,12 @@ class SourceType(Enum):
     WEB = "web"
 
 
-@dataclass
+# DB 문자열 → Enum 변환용 조회 테이블 (Enum 생성자 호출보다 빠름)
+STATUS_BY_VALUE: dict[str, ProcessingStatus] = {s.value: s for s in ProcessingStatus}
+SOURCE_BY_VALUE: dict[str, SourceType] = {s.value: s for s in SourceType}
+
+
+@dataclass(slots=True)
 class CollectedItem:
     """수집된 콘텐츠 항목"""
 
@@ -40,7 +45,7 @@ class CollectedItem:
     audio_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetSite:
     """웹 수집 대상 사이트 정보"""
 
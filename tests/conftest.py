@@ -0,0 +1,13 @@
+"""공용 pytest 설정"""
+
+try:
+    import uvloop
+except ImportError:  # uvloop은 선택 사항 (Windows 미지원)
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """비동기 테스트를 uvloop 이벤트 루프에서 실행합니다."""
+        return {"uvloop": uvloop.new_event_loop}
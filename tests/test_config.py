@@ -1,7 +1,9 @@
 """Settings 설정 로드 테스트"""
 
+import json
+import os
+
 import pytest
-import yaml
 
 from src.config import (
     GmailConfig,
@@ -12,44 +14,38 @@ from src.config import (
     WebSource,
 )
 
-
-@pytest.fixture
-def sample_config(tmp_path):
-    """테스트용 설정 파일 생성"""
-    config = {
-        "gmail": {
-            "credentials_path": "config/credentials.json",
-            "token_path": "config/token.json",
-            "allowed_senders": ["test@example.com"],
-            "max_results": 5,
-        },
-        "web_sources": [
-            {
-                "name": "TestBlog",
-                "url": "https://test.com",
-                "type": "rss",
-                "rss_url": "https://test.com/feed",
-            }
-        ],
-        "notebooklm": {
-            "chrome_user_data_dir": "/tmp/chrome",
-            "chrome_profile": "Test",
-            "timeout_seconds": 60,
-            "retry_count": 1,
-        },
-        "telegram": {
-            "bot_token": "test-token",
-            "channel_id": "-100123456",
-        },
-        "storage": {
-            "db_path": "data/test.db",
-            "temp_audio_dir": "data/tmp",
-            "max_age_hours": 12,
-        },
-    }
-    config_path = tmp_path / "settings.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(config, f)
+SAMPLE_YAML = """\
+gmail:
+  credentials_path: config/credentials.json
+  token_path: config/token.json
+  allowed_senders:
+    - test@example.com
+  max_results: 5
+web_sources:
+  - name: TestBlog
+    url: https://test.com
+    type: rss
+    rss_url: https://test.com/feed
+notebooklm:
+  chrome_user_data_dir: /tmp/chrome
+  chrome_profile: Test
+  timeout_seconds: 60
+  retry_count: 1
+telegram:
+  bot_token: test-token
+  channel_id: "-100123456"
+storage:
+  db_path: data/test.db
+  temp_audio_dir: data/tmp
+  max_age_hours: 12
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_config(tmp_path_factory):
+    """테스트용 설정 파일 생성 (내용이 변하지 않으므로 세션당 한 번)"""
+    config_path = tmp_path_factory.mktemp("cfg") / "settings.yaml"
+    config_path.write_text(SAMPLE_YAML, encoding="utf-8")
     return config_path
 
 
@@ -67,6 +63,48 @@ class TestSettings:
         assert settings.notebooklm.timeout_seconds == 60
         assert settings.storage.max_age_hours == 12
 
+    def test_load_returns_independent_instances(self, sample_config):
+        """캐시를 사용해도 호출마다 독립된 인스턴스를 반환하는지 테스트"""
+        first = Settings.load(config_path=str(sample_config), env_path="/nonexistent")
+        second = Settings.load(config_path=str(sample_config), env_path="/nonexistent")
+        assert first == second
+        assert first is not second
+
+        first.gmail.allowed_senders.append("other@example.com")
+        assert second.gmail.allowed_senders == ["test@example.com"]
+
+    def test_load_reparses_when_size_changes(self, sample_config, tmp_path):
+        """mtime이 같아도 파일 크기가 바뀌면 다시 파싱하는지 테스트"""
+        # 세션 공용 파일은 건드리지 않도록 복사본 사용
+        config_path = tmp_path / "settings.yaml"
+        config_path.write_bytes(sample_config.read_bytes())
+        first = Settings.load(config_path=str(config_path), env_path="/nonexistent")
+
+        stat = config_path.stat()
+        config_path.write_text(
+            SAMPLE_YAML.replace("max_results: 5", "max_results: 50"), encoding="utf-8"
+        )
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = Settings.load(config_path=str(config_path), env_path="/nonexistent")
+
+        assert first.gmail.max_results == 5
+        assert second.gmail.max_results == 50
+
+    def test_load_resolves_env_each_time(self, tmp_path, monkeypatch):
+        """파일이 그대로여도 환경 변수가 바뀌면 새 값으로 치환하는지 테스트"""
+        config_path = tmp_path / "settings.yaml"
+        config_path.write_text(
+            json.dumps({"telegram": {"bot_token": "${TEST_TOKEN}"}}), encoding="utf-8"
+        )
+
+        monkeypatch.setenv("TEST_TOKEN", "token-v1")
+        first = Settings.load(config_path=str(config_path), env_path="/nonexistent")
+        monkeypatch.setenv("TEST_TOKEN", "token-v2")
+        second = Settings.load(config_path=str(config_path), env_path="/nonexistent")
+
+        assert first.telegram.bot_token == "token-v1"
+        assert second.telegram.bot_token == "token-v2"
+
     def test_missing_config_file(self):
         """존재하지 않는 설정 파일 로드 시 에러 테스트"""
         with pytest.raises(FileNotFoundError):
@@ -83,11 +121,36 @@ class TestSettings:
         result = Settings._resolve_env("${NONEXISTENT_VAR}")
         assert result == ""
 
+    def test_env_resolution_embedded(self, monkeypatch):
+        """문자열 중간의 환경 변수 치환 테스트"""
+        monkeypatch.setenv("TEST_HOME", "/home/test")
+        result = Settings._resolve_env("${TEST_HOME}/data/${NONEXISTENT_VAR}db")
+        assert result == "/home/test/data/db"
+
     def test_env_resolution_plain_string(self):
         """일반 문자열은 치환하지 않음 테스트"""
         result = Settings._resolve_env("plain-value")
         assert result == "plain-value"
 
+    def test_env_resolution_all_fields(self, tmp_path, monkeypatch):
+        """텔레그램 외 필드도 환경 변수 치환되는지 테스트"""
+        monkeypatch.setenv("TEST_DB_PATH", "/tmp/env.db")
+        monkeypatch.setenv("TEST_SENDER", "env@example.com")
+        config_path = tmp_path / "env.yaml"
+        # JSON은 YAML의 부분 집합이므로 C 구현 인코더로 바로 작성
+        config_path.write_text(
+            json.dumps(
+                {
+                    "gmail": {"allowed_senders": ["${TEST_SENDER}"]},
+                    "storage": {"db_path": "${TEST_DB_PATH}"},
+                }
+            )
+        )
+
+        settings = Settings.load(config_path=str(config_path), env_path="/nonexistent")
+        assert settings.gmail.allowed_senders == ["env@example.com"]
+        assert settings.storage.db_path == "/tmp/env.db"
+
     def test_validate_warnings(self, sample_config):
         """설정 검증 경고 테스트"""
         settings = Settings.load(config_path=str(sample_config), env_path="/nonexistent")
@@ -0,0 +1,47 @@
+"""FeedCache 테스트"""
+
+import pytest
+
+from src.database.feed_cache import FeedCache, FeedState
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    """테스트용 피드 캐시"""
+    feed_cache = FeedCache(str(tmp_path / "test.db"))
+    await feed_cache.initialize()
+    yield feed_cache
+    await feed_cache.close()
+
+
+class TestFeedCache:
+    """FeedCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_missing(self, cache):
+        """저장되지 않은 피드 조회 테스트"""
+        assert await cache.get("https://example.com/feed") is None
+
+    @pytest.mark.asyncio
+    async def test_put_and_get(self, cache):
+        """피드 상태 저장 후 조회 테스트"""
+        state = FeedState(
+            etag='"abc"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+            first_link="https://example.com/post1",
+        )
+        await cache.put("https://example.com/feed", state)
+
+        assert await cache.get("https://example.com/feed") == state
+
+    @pytest.mark.asyncio
+    async def test_put_overwrites(self, cache):
+        """같은 피드를 다시 저장하면 덮어쓰는지 테스트"""
+        await cache.put("https://example.com/feed", FeedState(etag='"v1"'))
+        await cache.put(
+            "https://example.com/feed",
+            FeedState(first_link="https://example.com/post2"),
+        )
+
+        state = await cache.get("https://example.com/feed")
+        assert state == FeedState(first_link="https://example.com/post2")
@@ -0,0 +1,89 @@
+"""GmailCollector 본문 추출 테스트"""
+
+import base64
+
+import pytest
+
+# Gmail API 클라이언트가 설치된 환경에서만 실행
+gmail_collector = pytest.importorskip("src.collector.gmail_collector")
+GmailCollector = gmail_collector.GmailCollector
+
+
+def encode(text: str) -> str:
+    """Gmail API 형식(base64url)으로 본문을 인코딩합니다."""
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def make_part(mime_type: str, text: str) -> dict:
+    """본문 데이터가 있는 단일 MIME 파트를 생성합니다."""
+    return {"mimeType": mime_type, "body": {"data": encode(text)}}
+
+
+def make_message(*parts: dict) -> dict:
+    """multipart/mixed → multipart/alternative 구조의 메일을 생성합니다."""
+    return {
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "body": {"size": 0},
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "body": {"size": 0},
+                    "parts": list(parts),
+                },
+                {
+                    "mimeType": "application/pdf",
+                    "filename": "attachment.pdf",
+                    "body": {"attachmentId": "abc"},
+                },
+            ],
+        }
+    }
+
+
+class TestGetBody:
+    """GmailCollector._get_body 테스트"""
+
+    def test_single_part(self):
+        """본문이 payload에 바로 있는 메일 테스트"""
+        msg = {"payload": make_part("text/html", "<p>hello</p>")}
+        assert GmailCollector._get_body(msg) == b"<p>hello</p>"
+
+    def test_nested_html(self):
+        """중첩 멀티파트에서 text/html 파트를 찾는지 테스트"""
+        msg = make_message(
+            make_part("text/plain", "plain https://example.com/plain"),
+            make_part("text/html", '<a href="https://example.com/html">link</a>'),
+        )
+        assert (
+            GmailCollector._get_body(msg)
+            == b'<a href="https://example.com/html">link</a>'
+        )
+
+    def test_plain_fallback(self):
+        """HTML 파트가 없으면 text/plain 파트를 사용하는지 테스트"""
+        msg = make_message(make_part("text/plain", "plain https://example.com/plain"))
+        body = GmailCollector._get_body(msg)
+
+        assert body == b"plain https://example.com/plain"
+        assert GmailCollector._extract_urls(body) == ["https://example.com/plain"]
+
+    def test_non_utf8_charset(self):
+        """UTF-8이 아닌 charset의 본문을 해당 인코딩으로 디코딩하는지 테스트"""
+        html = '<a href="https://example.com/kr">한글 뉴스레터</a>'
+        part = {
+            "mimeType": "text/html",
+            "headers": [
+                {"name": "Content-Type", "value": 'text/html; charset="EUC-KR"'}
+            ],
+            "body": {"data": base64.urlsafe_b64encode(html.encode("euc-kr")).decode()},
+        }
+        body = GmailCollector._get_body(make_message(part))
+
+        assert body == html
+        assert GmailCollector._extract_urls(body) == ["https://example.com/kr"]
+
+    def test_no_text_part(self):
+        """텍스트 파트가 없으면 빈 본문을 반환하는지 테스트"""
+        msg = make_message()
+        assert GmailCollector._get_body(msg) == b""
@@ -4,7 +4,14 @@ from datetime import datetime
 
 import pytest
 
-from src.models import CollectedItem, ProcessingStatus, SourceType, TargetSite
+from src.models import (
+    SOURCE_BY_VALUE,
+    STATUS_BY_VALUE,
+    CollectedItem,
+    ProcessingStatus,
+    SourceType,
+    TargetSite,
+)
 
 
 class TestCollectedItem:
@@ -39,21 +46,39 @@ class TestCollectedItem:
         assert item.status == ProcessingStatus.COMPLETED
         assert item.collected_at == now
 
+    def test_slots(self):
+        """인스턴스별 __dict__ 없이 슬롯만 사용하는지 테스트"""
+        item = CollectedItem(url="https://example.com/article")
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown_field = "x"
+
 
 class TestProcessingStatus:
     """ProcessingStatus Enum 테스트"""
 
-    def test_values(self):
-        """모든 상태 값 테스트"""
-        assert ProcessingStatus.PENDING.value == "pending"
-        assert ProcessingStatus.PROCESSING.value == "processing"
-        assert ProcessingStatus.COMPLETED.value == "completed"
-        assert ProcessingStatus.FAILED.value == "failed"
-
-    def test_from_string(self):
-        """문자열에서 Enum 변환 테스트"""
-        assert ProcessingStatus("pending") == ProcessingStatus.PENDING
-        assert ProcessingStatus("completed") == ProcessingStatus.COMPLETED
+    @pytest.mark.parametrize(
+        ("status", "value"),
+        [
+            (ProcessingStatus.PENDING, "pending"),
+            (ProcessingStatus.PROCESSING, "processing"),
+            (ProcessingStatus.COMPLETED, "completed"),
+            (ProcessingStatus.FAILED, "failed"),
+        ],
+    )
+    def test_value_round_trip(self, status, value):
+        """상태 값과 문자열 → Enum 변환 테스트"""
+        assert status.value == value
+        assert ProcessingStatus(value) is status
+        assert STATUS_BY_VALUE[value] is status
+
+
+class TestSourceType:
+    """SourceType Enum 테스트"""
+
+    def test_lookup_table(self):
+        """문자열 → SourceType 조회 테이블 테스트"""
+        assert SOURCE_BY_VALUE == {"gmail": SourceType.GMAIL, "web": SourceType.WEB}
 
 
 class TestTargetSite:
@@ -1,16 +1,33 @@
 """URLRepository 테스트 - 인메모리 SQLite 사용"""
 
+import sqlite3
+from datetime import datetime
+
 import pytest
 
 from src.database.repository import URLRepository
 from src.models import CollectedItem, ProcessingStatus, SourceType
 
+# 파일 DB 테스트용 PRAGMA - 저널링/fsync 생략 (내구성 보장 없음)
+FAST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+)
+
+
+async def open_file_repo(db_path: str) -> URLRepository:
+    """파일 DB repository를 초기화하고 테스트용 PRAGMA를 적용합니다."""
+    repository = URLRepository(db_path)
+    await repository.initialize()
+    for pragma in FAST_PRAGMAS:
+        await repository._db.execute(pragma)
+    return repository
+
 
 @pytest.fixture
-async def repo(tmp_path):
+async def repo():
     """테스트용 인메모리 DB repository"""
-    db_path = str(tmp_path / "test.db")
-    repository = URLRepository(db_path)
+    repository = URLRepository(":memory:")
     await repository.initialize()
     yield repository
     await repository.close()
@@ -49,6 +66,19 @@ class TestURLRepository:
         assert await repo.is_duplicate("https://example.com/article1") is True
         assert await repo.is_duplicate("https://example.com/article2") is False
 
+    @pytest.mark.asyncio
+    async def test_filter_new(self, repo):
+        """신규 URL만 골라내는지 테스트"""
+        await repo.save(
+            CollectedItem(url="https://example.com/old", source=SourceType.WEB)
+        )
+
+        new_urls = await repo.filter_new(
+            ["https://example.com/old", "https://example.com/new"]
+        )
+        assert new_urls == {"https://example.com/new"}
+        assert await repo.filter_new([]) == set()
+
     @pytest.mark.asyncio
     async def test_update_status(self, repo):
         """상태 업데이트 테스트"""
@@ -71,6 +101,35 @@ class TestURLRepository:
             audio_path="/tmp/audio.mp3",
         )
 
+    @pytest.mark.asyncio
+    async def test_update_status_deferred_commit(self, tmp_path):
+        """commit=False 업데이트가 flush 후에 다른 연결에서 보이는지 테스트"""
+        db_path = str(tmp_path / "test.db")
+        repository = await open_file_repo(db_path)
+
+        def read_status() -> str:
+            conn = sqlite3.connect(db_path)
+            try:
+                return conn.execute(
+                    "SELECT status FROM processed_urls WHERE id = ?", (item_id,)
+                ).fetchone()[0]
+            finally:
+                conn.close()
+
+        try:
+            item_id = await repository.save(
+                CollectedItem(url="https://example.com/deferred", source=SourceType.WEB)
+            )
+            await repository.update_status(
+                item_id, ProcessingStatus.PROCESSING, commit=False
+            )
+
+            assert read_status() == ProcessingStatus.PENDING.value
+            await repository.flush()
+            assert read_status() == ProcessingStatus.PROCESSING.value
+        finally:
+            await repository.close()
+
     @pytest.mark.asyncio
     async def test_update_status_failed(self, repo):
         """실패 상태 업데이트 테스트"""
@@ -100,33 +159,130 @@ class TestURLRepository:
         await repo.save(item)
 
         # 동일 URL 재저장 시 에러
-        with pytest.raises(Exception):
+        with pytest.raises(sqlite3.IntegrityError):
             await repo.save(item)
 
     @pytest.mark.asyncio
     async def test_multiple_items(self, repo):
         """다수 항목 저장 및 조회 테스트"""
-        for i in range(5):
-            item = CollectedItem(
+        items = [
+            CollectedItem(
                 url=f"https://example.com/article{i}",
                 title=f"기사 {i}",
                 source=SourceType.WEB,
             )
-            await repo.save(item)
+            for i in range(5)
+        ]
+        await repo.save_many(items)
 
         pending = await repo.get_pending()
         assert len(pending) == 5
 
+    @pytest.mark.asyncio
+    async def test_save_many(self, repo):
+        """일괄 저장 후 입력 순서대로 ID가 반환되는지 테스트"""
+        items = [
+            CollectedItem(url=f"https://example.com/batch{i}", source=SourceType.WEB)
+            for i in range(3)
+        ]
+        ids = await repo.save_many(items)
+
+        assert len(set(ids)) == 3
+        pending = await repo.get_pending()
+        assert {item.id: item.url for item in pending} == {
+            item_id: item.url for item_id, item in zip(ids, items)
+        }
+        assert await repo.save_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_save_many_failure_keeps_deferred_status(self, repo):
+        """일괄 저장이 실패해도 미뤄 둔 상태 업데이트는 유지되는지 테스트"""
+        item_id = await repo.save(
+            CollectedItem(url="https://example.com/deferred", source=SourceType.WEB)
+        )
+        await repo.update_status(item_id, ProcessingStatus.PROCESSING, commit=False)
+
+        duplicate = CollectedItem(
+            url="https://example.com/deferred", source=SourceType.WEB
+        )
+        with pytest.raises(sqlite3.IntegrityError):
+            await repo.save_many([duplicate])
+
+        assert repo._dirty == 0
+        assert await repo.get_pending() == []
+        cursor = await repo._db.execute(
+            "SELECT status FROM processed_urls WHERE id = ?", (item_id,)
+        )
+        assert (await cursor.fetchone())[0] == ProcessingStatus.PROCESSING.value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("limit", "expected"), [(None, 5), (2, 2), (10, 5)])
+    async def test_get_pending_limit(self, repo, limit, expected):
+        """get_pending 개수 제한 테스트"""
+        await repo.save_many(
+            [
+                CollectedItem(
+                    url=f"https://example.com/limit{i}", source=SourceType.WEB
+                )
+                for i in range(5)
+            ]
+        )
+
+        pending = await repo.get_pending(limit=limit)
+        assert len(pending) == expected
+
     @pytest.mark.asyncio
     async def test_recent_count(self, repo):
         """최근 수집 항목 수 조회 테스트"""
-        for i in range(3):
-            item = CollectedItem(
+        items = [
+            CollectedItem(
                 url=f"https://example.com/recent{i}",
                 title=f"최근 기사 {i}",
                 source=SourceType.GMAIL,
             )
-            await repo.save(item)
+            for i in range(3)
+        ]
+        await repo.save_many(items)
 
         count = await repo.get_recent_count(hours=24)
         assert count == 3
+
+    @pytest.mark.asyncio
+    async def test_migrate_legacy_url_hash(self, tmp_path):
+        """url_hash 컬럼이 있는 이전 스키마 DB 변환 테스트"""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE processed_urls (
+                id           INTEGER PRIMARY KEY AUTOINCREMENT,
+                url          TEXT NOT NULL UNIQUE,
+                url_hash     TEXT NOT NULL UNIQUE,
+                title        TEXT,
+                source       TEXT NOT NULL,
+                source_name  TEXT,
+                status       TEXT DEFAULT 'pending',
+                error_msg    TEXT,
+                audio_path   TEXT,
+                collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                completed_at TIMESTAMP,
+                created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO processed_urls (url, url_hash, title, source, collected_at)
+            VALUES ('https://example.com/legacy', 'abc', '이전 기사', 'web',
+                    '2024-01-01T00:00:00');
+            """
+        )
+        conn.close()
+
+        repository = await open_file_repo(db_path)
+        try:
+            assert await repository.is_duplicate("https://example.com/legacy")
+            pending = await repository.get_pending()
+            assert pending[0].collected_at == datetime(2024, 1, 1)
+            item_id = await repository.save(
+                CollectedItem(url="https://example.com/after", source=SourceType.WEB)
+            )
+            assert item_id == 2
+        finally:
+            await repository.close()
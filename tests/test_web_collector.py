@@ -0,0 +1,173 @@
+"""WebCollector RSS 수집 테스트"""
+
+import httpx
+import pytest
+
+from src.database.feed_cache import FeedCache, FeedState
+from src.models import TargetSite
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    """테스트용 피드 캐시"""
+    feed_cache = FeedCache(str(tmp_path / "test.db"))
+    await feed_cache.initialize()
+    yield feed_cache
+    await feed_cache.close()
+
+
+FEED_URL = "https://example.com/feed"
+
+SAMPLE_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>Post 1</title><link>https://example.com/post1</link></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def web_collector_module():
+    """WebCollector 모듈 (Playwright/lxml이 없으면 건너뜀)"""
+    return pytest.importorskip("src.collector.web_collector")
+
+
+def make_collector(module, cache, handler):
+    """모의 HTTP 응답을 사용하는 WebCollector를 생성합니다."""
+    collector = module.WebCollector(feed_cache=cache)
+    collector._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return collector
+
+
+class TestFetchFromRSS:
+    """WebCollector._fetch_from_rss의 피드 캐시 처리 테스트"""
+
+    SITE = TargetSite(name="Example", url="https://example.com", rss_url=FEED_URL)
+
+    @pytest.mark.asyncio
+    async def test_not_modified(self, cache, web_collector_module):
+        """304 응답이면 수집하지 않고 캐시도 그대로인지 테스트"""
+        cached = FeedState(etag='"v1"', first_link="https://example.com/post1")
+        await cache.put(FEED_URL, cached)
+
+        def handler(request):
+            assert request.headers["If-None-Match"] == '"v1"'
+            return httpx.Response(304)
+
+        collector = make_collector(web_collector_module, cache, handler)
+        try:
+            assert await collector._fetch_from_rss(self.SITE) == []
+        finally:
+            await collector.close()
+
+        assert collector.pending_feed_states == {}
+        assert await cache.get(FEED_URL) == cached
+
+    @pytest.mark.asyncio
+    async def test_same_first_link(self, cache, web_collector_module):
+        """최신 게시글이 같으면 수집하지 않고 검증 헤더만 갱신하는지 테스트"""
+        await cache.put(
+            FEED_URL, FeedState(etag='"v1"', first_link="https://example.com/post1")
+        )
+
+        def handler(request):
+            return httpx.Response(200, headers={"ETag": '"v2"'}, content=SAMPLE_RSS)
+
+        collector = make_collector(web_collector_module, cache, handler)
+        try:
+            assert await collector._fetch_from_rss(self.SITE) == []
+        finally:
+            await collector.close()
+
+        assert collector.pending_feed_states == {}
+        assert await cache.get(FEED_URL) == FeedState(
+            etag='"v2"', first_link="https://example.com/post1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_new_entry_defers_cache(self, cache, web_collector_module):
+        """새 게시글의 피드 상태는 저장 전까지 캐시에 기록되지 않는지 테스트"""
+
+        def handler(request):
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=SAMPLE_RSS)
+
+        collector = make_collector(web_collector_module, cache, handler)
+        try:
+            items = await collector._fetch_from_rss(self.SITE)
+        finally:
+            await collector.close()
+
+        assert [item.url for item in items] == ["https://example.com/post1"]
+        assert await cache.get(FEED_URL) is None
+        assert collector.pending_feed_states == {
+            FEED_URL: FeedState(etag='"v1"', first_link="https://example.com/post1")
+        }
+
+
+SAMPLE_ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<entry>
+<title>Atom Post</title>
+<link rel="enclosure" href="https://example.com/audio.mp3"/>
+<link rel="alternate" href="https://example.com/atom-post"/>
+</entry>
+</feed>"""
+
+SAMPLE_RSS1 = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/">
+<channel><title>Example</title><link>https://example.com</link></channel>
+<item><title>RSS1 Post</title><link>https://example.com/rss1-post</link></item>
+</rdf:RDF>"""
+
+# 링크 없이 guid만 있는 항목 (XML로는 정상이지만 직접 파서가 링크를 찾지 못함)
+SAMPLE_GUID_ONLY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>Guid Post</title>
+<guid isPermaLink="true">https://example.com/guid-post</guid></item>
+</channel></rss>"""
+
+# 닫히지 않은 태그가 있는 비정상 XML
+SAMPLE_MALFORMED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>Broken Post</title><link>https://example.com/broken</link></item>
+<br>
+</channel></rss>"""
+
+
+class TestParseLatestEntry:
+    """WebCollector._parse_latest_entry 피드 형식별 테스트"""
+
+    SITE = TargetSite(name="Example", url="https://example.com", rss_url=FEED_URL)
+
+    @pytest.mark.asyncio
+    async def test_atom_alternate_link(self, web_collector_module):
+        """Atom 게시글의 rel="alternate" 링크를 사용하는지 테스트"""
+        collector = web_collector_module.WebCollector()
+        entry = await collector._parse_latest_entry(self.SITE, SAMPLE_ATOM)
+
+        assert entry == ("https://example.com/atom-post", "Atom Post")
+
+    @pytest.mark.asyncio
+    async def test_rss1(self, web_collector_module):
+        """RSS 1.0(RDF) 피드의 게시글을 읽는지 테스트"""
+        collector = web_collector_module.WebCollector()
+        entry = await collector._parse_latest_entry(self.SITE, SAMPLE_RSS1)
+
+        assert entry == ("https://example.com/rss1-post", "RSS1 Post")
+
+    @pytest.mark.asyncio
+    async def test_missing_link_falls_back(self, web_collector_module):
+        """링크를 찾지 못한 정상 XML은 feedparser로 처리하는지 테스트"""
+        pytest.importorskip("feedparser")
+        collector = web_collector_module.WebCollector()
+        entry = await collector._parse_latest_entry(self.SITE, SAMPLE_GUID_ONLY)
+
+        assert entry == ("https://example.com/guid-post", "Guid Post")
+
+    @pytest.mark.asyncio
+    async def test_malformed_xml_falls_back(self, web_collector_module):
+        """XML 파싱에 실패하면 feedparser로 처리하는지 테스트"""
+        pytest.importorskip("feedparser")
+        collector = web_collector_module.WebCollector()
+        entry = await collector._parse_latest_entry(self.SITE, SAMPLE_MALFORMED)
+
+        assert entry == ("https://example.com/broken", "Broken Post")